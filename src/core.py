@@ -42,7 +42,7 @@ class SyncSession:
 
 
 # NOTE: Avoid importing `aqt` at module import time so tests remain headless.
-# Tests patch this symbol directly (e.g., `monkeypatch.setattr("src.core.mw", ...)`).
+# Tests patch this symbol directly (e.g., `monkeypatch.setattr(core, "mw", ...)`).
 mw: Optional[Any] = None
 
 
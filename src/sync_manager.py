@@ -71,27 +71,28 @@ class SyncManager:
             # Skip auto-sync if Anki main window is not available
             if get_mw_or_none() is None:
                 self.logger.debug(
-                    f"Anki main window not available, skipping auto-sync for {trigger_event}"
+                    "Anki main window not available, skipping auto-sync for %s",
+                    trigger_event,
                 )
                 return
 
             # Check if auto-sync is enabled
             config = get_config()
             if not config.get(CONFIG_AUTO_SYNC, False):
-                self.logger.debug(f"Auto-sync is disabled for {trigger_event}")
+                self.logger.debug("Auto-sync is disabled for %s", trigger_event)
                 return
 
             # Check if configured
             if not is_configured():
                 self.logger.debug(
-                    f"Toggl not configured, skipping auto-sync for {trigger_event}"
+                    "Toggl not configured, skipping auto-sync for %s", trigger_event
                 )
                 return
 
             # Run sync in background to avoid blocking UI
             threading.Thread(target=self._perform_auto_sync, daemon=True).start()
         except Exception as e:
-            self.logger.debug(f"Auto-sync skipped for {trigger_event} due to: {e}")
+            self.logger.debug("Auto-sync skipped for %s due to: %s", trigger_event, e)
 
     def _perform_auto_sync(self) -> None:
         """Perform the actual auto-sync in a background thread."""
@@ -120,7 +121,11 @@ class SyncManager:
             description = cast("str", credentials["description"])
             tz_name = getattr(timezone, "name", str(timezone))
             self.logger.debug(
-                f"Auto-sync params: workspace_id={workspace_id}, project_id={project_id}, description='{description}', timezone={tz_name}"
+                "Auto-sync params: workspace_id=%s, project_id=%s, description='%s', timezone=%s",
+                workspace_id,
+                project_id,
+                description,
+                tz_name,
             )
             response = sync_review_time_to_toggl(
                 api_token,
@@ -138,16 +143,17 @@ class SyncManager:
                 self.logger.info("Auto-sync: Successfully synced review time to Toggl")
             else:
                 self.logger.warning(
-                    f"Auto-sync: Sync completed but got unexpected response: {response}"
+                    "Auto-sync: Sync completed but got unexpected response: %s",
+                    response,
                 )
             if hasattr(response, "status_code"):
-                self.logger.debug(f"Auto-sync response status: {response.status_code}")
+                self.logger.debug("Auto-sync response status: %s", response.status_code)
         except TogglSyncError as e:
             self.logger.error(
                 "Network error during auto-sync: %s", str(e), exc_info=True
             )
         except ConfigValidationError as e:
-            self.logger.error(f"Auto-sync: ConfigValidationError: {e}")
+            self.logger.error("Auto-sync: ConfigValidationError: %s", e)
         except Exception as e:
             self.logger.error(
                 "Unexpected error during auto-sync: %s", str(e), exc_info=True
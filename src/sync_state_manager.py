@@ -25,6 +25,8 @@ Entry data includes all information needed for duplicate detection and updates.
 import json
 import os
 import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Optional, Union
@@ -47,6 +49,7 @@ class SyncStateManager:
             default_dir = addon_dir / "sync_state"
             default_dir.mkdir(parents=True, exist_ok=True)
             self.state_file = default_dir / "sync_state.json"
+        self._batch_depth: int = 0
         self._synced_entries: dict[str, Any] = self._load_synced_entries()
 
     def _load_synced_entries(self):
@@ -106,6 +109,21 @@ class SyncStateManager:
             self.logger.error(f"Unexpected error saving sync state: {e}", exc_info=True)
             raise
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer state file writes until the outermost block exits, then save once.
+
+        Nested blocks are allowed. If the block raises, nothing is saved and the
+        original exception propagates.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+        if not self._batch_depth:
+            self._save_synced_entries()
+
     def _generate_entry_key(
         self, target_date: date, workspace_id: int, project_id: int, description: str
     ) -> str:
@@ -162,7 +180,8 @@ class SyncStateManager:
         if action is not None:
             entry_data["action"] = action
         self._synced_entries[key] = entry_data
-        self._save_synced_entries()
+        if not self._batch_depth:
+            self._save_synced_entries()
         self.logger.info(
             f"Recorded sync for {key} (action: {action}, toggl_id: {toggl_id})"
         )
@@ -176,6 +195,7 @@ class SyncStateManager:
         if key in self._synced_entries:
             self.logger.info(f"Clearing stale sync state for {key}")
             del self._synced_entries[key]
-            self._save_synced_entries()
+            if not self._batch_depth:
+                self._save_synced_entries()
         else:
             self.logger.debug(f"No sync state found to clear for {key}")
@@ -39,6 +39,8 @@ class TogglTrackEntryCreator:
         )
         self.user_api_url: str = f"{TOGGL_API_BASE_URL}/{TOGGL_USER_ENDPOINT}"
         self.session: requests.Session = requests.Session()
+        # Built once: the token and add-on version are fixed for this instance
+        self._request_headers: dict[str, str] = self._build_headers()
         if timezone is None:
             self.timezone = get_timezone()
         elif isinstance(timezone, str):
@@ -54,6 +56,9 @@ class TogglTrackEntryCreator:
         self.session.close()
 
     def _headers(self) -> dict[str, str]:
+        return self._request_headers
+
+    def _build_headers(self) -> dict[str, str]:
         token = b64encode(f"{self.api_token}:api_token".encode()).decode("utf-8")
         name, version = get_addon_name_and_version()
         return {
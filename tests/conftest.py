@@ -2,17 +2,22 @@
 Shared pytest fixtures for the Anki Toggl add-on test suite.
 
 This module provides common fixtures to reduce duplication across test files.
+Mocks here are plain Mock/MagicMock objects without spec or autospec; tests
+that need strict attribute checking should add a spec locally.
 """
 
 pytest_plugins = ["tests.test_shared_fixtures"]
 
 import sys
 import types
+from collections.abc import Iterator, Mapping
 from datetime import datetime, timezone
-from typing import Any, Callable, cast
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, NamedTuple
 from unittest.mock import MagicMock, Mock
 
 import pytest
+import requests
 
 # Import constants directly to avoid triggering src package initialization
 HTTP_BAD_REQUEST = 400
@@ -46,6 +51,22 @@ if "aqt" not in sys.modules:
     sys.modules["aqt.qt"] = qt_stub
 
 
+class FakeResponse:
+    """Minimal requests.Response stand-in exposing status, text and JSON body."""
+
+    __slots__ = ("_json", "status_code", "text")
+
+    def __init__(self, status: int = HTTP_OK, json_data: Any = None, text: str = ""):
+        self.status_code, self._json, self.text = status, json_data, text
+
+    def json(self) -> Any:
+        return self._json
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= HTTP_BAD_REQUEST:
+            raise requests.HTTPError(self.text, response=self)
+
+
 @pytest.fixture(scope="session")
 def mock_anki_mw() -> MagicMock:
     """Create a mock Anki main window with database."""
@@ -86,182 +107,66 @@ def mock_sync_state_manager_already_synced() -> Mock:
     return mock_manager
 
 
+# Session-scoped session-info fixtures are shared by every test, so they are
+# returned as read-only mappings to keep one test from leaking into another.
 @pytest.fixture(scope="session")
-def sample_session_info() -> dict[str, Any]:
+def sample_session_info() -> Mapping[str, Any]:
     """Create sample session info with realistic datetime values."""
     mock_first_review = datetime(2023, 1, 15, 9, 0, 0, tzinfo=timezone.utc)
     mock_last_review = datetime(2023, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
-    return {
-        "first_review_time": mock_first_review,
-        "last_review_time": mock_last_review,
-        "total_duration_ms": 60000,
-        "session_count": 10,
-    }
+    return MappingProxyType(
+        {
+            "first_review_time": mock_first_review,
+            "last_review_time": mock_last_review,
+            "total_duration_ms": 60000,
+            "session_count": 10,
+        }
+    )
 
 
 @pytest.fixture(scope="session")
-def sample_session_info_with_range() -> dict[str, Any]:
+def sample_session_info_with_range() -> Mapping[str, Any]:
     """Create sample session info spanning multiple time periods."""
     morning_start = datetime(2023, 1, 15, 9, 0, 0, tzinfo=timezone.utc)
     afternoon_end = datetime(2023, 1, 15, 15, 30, 0, tzinfo=timezone.utc)
-    return {
-        "first_review_time": morning_start,
-        "last_review_time": afternoon_end,
-        "total_duration_ms": 120000,  # 2 minutes
-        "session_count": 20,
-    }
+    return MappingProxyType(
+        {
+            "first_review_time": morning_start,
+            "last_review_time": afternoon_end,
+            "total_duration_ms": 120000,  # 2 minutes
+            "session_count": 20,
+        }
+    )
 
 
 @pytest.fixture(scope="session")
-def empty_session_info() -> dict[str, Any]:
+def empty_session_info() -> Mapping[str, Any]:
     """Create empty session info with no review time."""
-    return {
-        "first_review_time": None,
-        "last_review_time": None,
-        "total_duration_ms": 0,
-        "session_count": 0,
-    }
+    return MappingProxyType(
+        {
+            "first_review_time": None,
+            "last_review_time": None,
+            "total_duration_ms": 0,
+            "session_count": 0,
+        }
+    )
 
 
-@pytest.fixture
-def mock_http_response() -> Mock:
-    """Create a mock HTTP response with status 200."""
-    mock_response = Mock()
-    mock_response.status_code = HTTP_OK
-    mock_response.text = "OK"
-    mock_response.json.return_value = []
-    return mock_response
-
-
-@pytest.fixture
-def mock_toggl_creator() -> type[Any]:
-    """Create a mock TogglTrackEntryCreator class with successful responses."""
-
-    class DummyTogglCreator:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
-
-        def create_entry(
-            self, start_time: Any, duration: Any, timezone_str: Any = None
-        ) -> Mock:
-            mock_response = Mock()
-            mock_response.status_code = HTTP_OK
-            mock_response.text = MOCK_RESPONSE_OK_TEXT
-            return mock_response
-
-        def create_or_update_entry(
-            self, start_time: Any, duration: Any, timezone_str: Any = None
-        ) -> Mock:
-            mock_response = Mock()
-            mock_response.status_code = HTTP_OK
-            mock_response.text = MOCK_RESPONSE_OK_TEXT
-            return mock_response
-
-        def update_entry(
-            self,
-            entry_id: Any,
-            duration: Any,
-            start_time: Any,
-            timezone_str: Any = None,
-        ) -> Mock:
-            mock_response = Mock()
-            mock_response.status_code = HTTP_OK
-            mock_response.text = MOCK_RESPONSE_OK_TEXT
-            return mock_response
-
-    return DummyTogglCreator
-
-
-@pytest.fixture
-def mock_toggl_creator_error() -> type[Any]:
-    """Create a mock TogglTrackEntryCreator class with error responses."""
-
-    class DummyTogglCreatorError:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
-
-        def create_entry(
-            self, start_time: Any, duration: Any, timezone_str: Any = None
-        ) -> Mock:
-            mock_response = Mock()
-            mock_response.status_code = HTTP_BAD_REQUEST
-            mock_response.text = MOCK_RESPONSE_ERROR_TEXT
-            return mock_response
-
-        def create_or_update_entry(
-            self, start_time: Any, duration: Any, timezone_str: Any = None
-        ) -> Mock:
-            mock_response = Mock()
-            mock_response.status_code = HTTP_BAD_REQUEST
-            mock_response.text = MOCK_RESPONSE_ERROR_TEXT
-            return mock_response
-
-        def update_entry(
-            self,
-            entry_id: Any,
-            duration: Any,
-            start_time: Any,
-            timezone_str: Any = None,
-        ) -> Mock:
-            mock_response = Mock()
-            mock_response.status_code = HTTP_BAD_REQUEST
-            mock_response.text = MOCK_RESPONSE_ERROR_TEXT
-            return mock_response
-
-    return DummyTogglCreatorError
-
+@pytest.fixture(scope="session")
+def utc_tz() -> Any:
+    """Create one UTC Timezone shared across the test session."""
+    from src.timezone import Timezone
 
-@pytest.fixture
-def mock_toggl_creator_with_tracking() -> type[Any]:
-    """Create a mock TogglTrackEntryCreator class that tracks calls."""
-
-    class DummyTogglCreatorWithTracking:
-        called = False
-
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
-
-        def create_entry(
-            self, start_time: Any, duration: Any, timezone_str: Any = None
-        ) -> Mock:
-            DummyTogglCreatorWithTracking.called = True
-            mock_response = Mock()
-            mock_response.status_code = HTTP_OK
-            mock_response.text = MOCK_RESPONSE_OK_TEXT
-            return mock_response
-
-        def create_or_update_entry(
-            self, start_time: Any, duration: Any, timezone_str: Any = None
-        ) -> Mock:
-            DummyTogglCreatorWithTracking.called = True
-            mock_response = Mock()
-            mock_response.status_code = HTTP_OK
-            mock_response.text = MOCK_RESPONSE_OK_TEXT
-            return mock_response
-
-        def update_entry(
-            self,
-            entry_id: Any,
-            duration: Any,
-            start_time: Any,
-            timezone_str: Any = None,
-        ) -> Mock:
-            DummyTogglCreatorWithTracking.called = True
-            mock_response = Mock()
-            mock_response.status_code = HTTP_OK
-            mock_response.text = MOCK_RESPONSE_OK_TEXT
-            return mock_response
-
-    return DummyTogglCreatorWithTracking
+    return Timezone("UTC")
 
 
 @pytest.fixture
 def mock_anki_review_tracker() -> Callable[[Any], Callable[[Any], MagicMock]]:
     """Create a mock AnkiReviewTracker factory function."""
 
-    def create_tracker(session_info: dict[str, Any]) -> Callable[[Any], MagicMock]:
+    def create_tracker(session_info: Mapping[str, Any]) -> Callable[[Any], MagicMock]:
         def tracker_factory(mw: Any) -> MagicMock:
-            def get_session_info() -> dict[str, Any]:
+            def get_session_info() -> Mapping[str, Any]:
                 return session_info
 
             return MagicMock(get_todays_review_session_info=get_session_info)
@@ -271,56 +176,178 @@ def mock_anki_review_tracker() -> Callable[[Any], Callable[[Any], MagicMock]]:
     return create_tracker
 
 
-@pytest.fixture
-def mock_session_request(mocker: Any) -> MagicMock:
-    """Mock the requests.Session.request method for HTTP testing."""
-    mock_request = cast("MagicMock", mocker.patch("requests.Session.request"))
-    mock_response = Mock()
-    mock_response.status_code = HTTP_OK
-    mock_response.json.return_value = []
-    mock_request.return_value = mock_response
-    return mock_request
+# Shared Toggl API responses; the stand-ins below never mutate them.
+_OK_RESPONSE = FakeResponse(HTTP_OK, {"id": TEST_RESPONSE_ID}, MOCK_RESPONSE_OK_TEXT)
+_ERROR_RESPONSE = FakeResponse(HTTP_BAD_REQUEST, text=MOCK_RESPONSE_ERROR_TEXT)
 
 
-@pytest.fixture
-def dummy_toggl_response() -> type[Any]:
-    """Create a dummy Toggl API response for testing."""
+class DummyTogglCreator:
+    """TogglTrackEntryCreator stand-in whose calls always succeed."""
 
-    class DummyResponse:
-        status_code = HTTP_OK
-        text = MOCK_RESPONSE_OK_TEXT
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
 
-        def json(self) -> dict[str, int]:
-            return {"id": TEST_RESPONSE_ID}
+    def create_entry(
+        self, start_time: Any, duration: Any, timezone_str: Any = None
+    ) -> FakeResponse:
+        return _OK_RESPONSE
 
-    return DummyResponse
+    def create_or_update_entry(
+        self, start_time: Any, duration: Any, timezone_str: Any = None
+    ) -> FakeResponse:
+        return _OK_RESPONSE
 
+    def update_entry(
+        self,
+        entry_id: Any,
+        duration: Any,
+        start_time: Any,
+        timezone_str: Any = None,
+    ) -> FakeResponse:
+        return _OK_RESPONSE
 
-@pytest.fixture
-def dummy_toggl_creator(dummy_toggl_response: type[Any]) -> type[Any]:
-    """Create a dummy TogglTrackEntryCreator for testing."""
-
-    class DummyTogglCreator:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
-
-        def create_entry(
-            self, start_time: Any, duration: Any, timezone_str: Any = None
-        ) -> Mock:
-            return dummy_toggl_response()
-
-        def create_or_update_entry(
-            self, start_time: Any, duration: Any, timezone_str: Any = None
-        ) -> Mock:
-            return dummy_toggl_response()
-
-        def update_entry(
-            self,
-            entry_id: Any,
-            duration: Any,
-            start_time: Any,
-            timezone_str: Any = None,
-        ) -> Mock:
-            return dummy_toggl_response()
 
+class UpdateCall(NamedTuple):
+    """Arguments of one captured update_entry call."""
+
+    entry_id: Any
+    duration: Any
+    start_time: Any
+    timezone_str: Any
+
+
+class CapturingTogglCreator(DummyTogglCreator):
+    """DummyTogglCreator that records the arguments of each update_entry call."""
+
+    captured_update_calls: ClassVar[list[UpdateCall]] = []
+
+    def update_entry(
+        self,
+        entry_id: Any,
+        duration: Any,
+        start_time: Any,
+        timezone_str: Any = None,
+    ) -> FakeResponse:
+        self.captured_update_calls.append(
+            UpdateCall(entry_id, duration, start_time, timezone_str)
+        )
+        return _OK_RESPONSE
+
+
+class ErrorTogglCreator:
+    """TogglTrackEntryCreator stand-in whose calls always get a 400 response."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def create_entry(
+        self, start_time: Any, duration: Any, timezone_str: Any = None
+    ) -> FakeResponse:
+        return _ERROR_RESPONSE
+
+    def create_or_update_entry(
+        self, start_time: Any, duration: Any, timezone_str: Any = None
+    ) -> FakeResponse:
+        return _ERROR_RESPONSE
+
+    def update_entry(
+        self,
+        entry_id: Any,
+        duration: Any,
+        start_time: Any,
+        timezone_str: Any = None,
+    ) -> FakeResponse:
+        return _ERROR_RESPONSE
+
+
+class TrackingTogglCreator(DummyTogglCreator):
+    """DummyTogglCreator that records whether any entry call was made."""
+
+    called: ClassVar[bool] = False
+
+    def create_entry(
+        self, start_time: Any, duration: Any, timezone_str: Any = None
+    ) -> FakeResponse:
+        TrackingTogglCreator.called = True
+        return _OK_RESPONSE
+
+    def create_or_update_entry(
+        self, start_time: Any, duration: Any, timezone_str: Any = None
+    ) -> FakeResponse:
+        TrackingTogglCreator.called = True
+        return _OK_RESPONSE
+
+    def update_entry(
+        self,
+        entry_id: Any,
+        duration: Any,
+        start_time: Any,
+        timezone_str: Any = None,
+    ) -> FakeResponse:
+        TrackingTogglCreator.called = True
+        return _OK_RESPONSE
+
+
+class NetworkErrorTogglCreator:
+    """TogglTrackEntryCreator stand-in whose create_entry fails to connect."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def create_entry(
+        self, start_time: Any, duration: Any, timezone_str: Any = None
+    ) -> None:
+        raise requests.ConnectionError("Network connection failed")
+
+
+@pytest.fixture(scope="module")
+def dummy_toggl_response() -> FakeResponse:
+    """Return the shared successful Toggl API response."""
+    return _OK_RESPONSE
+
+
+@pytest.fixture(scope="module")
+def dummy_toggl_creator() -> type[DummyTogglCreator]:
+    """Return a TogglTrackEntryCreator stand-in with successful responses."""
+    return DummyTogglCreator
+
+
+@pytest.fixture(scope="module")
+def mock_toggl_creator() -> type[DummyTogglCreator]:
+    """Return a TogglTrackEntryCreator stand-in with successful responses."""
     return DummyTogglCreator
+
+
+@pytest.fixture(scope="module")
+def mock_toggl_creator_error() -> type[ErrorTogglCreator]:
+    """Return a TogglTrackEntryCreator stand-in with error responses."""
+    return ErrorTogglCreator
+
+
+@pytest.fixture
+def mock_toggl_creator_with_tracking() -> Iterator[type[TrackingTogglCreator]]:
+    """Yield a TogglTrackEntryCreator stand-in that tracks calls in this test."""
+    TrackingTogglCreator.called = False
+    yield TrackingTogglCreator
+    TrackingTogglCreator.called = False
+
+
+@pytest.fixture(scope="module")
+def capturing_toggl_creator() -> type[CapturingTogglCreator]:
+    """Return a TogglTrackEntryCreator stand-in that captures update_entry calls."""
+    return CapturingTogglCreator
+
+
+@pytest.fixture
+def captured_update_calls() -> Iterator[list[UpdateCall]]:
+    """Yield the update_entry calls captured by CapturingTogglCreator in this test."""
+    calls = CapturingTogglCreator.captured_update_calls
+    calls.clear()
+    yield calls
+    calls.clear()
+
+
+@pytest.fixture(scope="module")
+def network_error_toggl_creator() -> type[NetworkErrorTogglCreator]:
+    """Return a TogglTrackEntryCreator stand-in that raises a network error."""
+    return NetworkErrorTogglCreator
@@ -1,16 +1,18 @@
 from datetime import datetime, timezone
 from typing import Optional, Tuple
-from unittest.mock import MagicMock, Mock
+from unittest.mock import Mock
 
 import pytest
+from pytest_mock import MockerFixture
 
 from src.anki_review_tracker import AnkiReviewTracker
 
+_FIXED_EPOCH_MS = int(datetime(2024, 10, 8).timestamp() * 1000)
+
 
 @pytest.mark.unit
-def test_get_todays_review_time_ms(mocker: MagicMock) -> None:
-    # Have to mock at this level rather than "aqt.mw.col" so mw is not None
-    mock_mw = mocker.patch("aqt.mw", autospec=True)
+def test_get_todays_review_time_ms(mocker: MockerFixture) -> None:
+    mock_mw = Mock()
 
     mock_mw.col.db.scalar.return_value = 300000
     mock_mw.col.db.first.return_value = (1728313200001, 1000)  # id, time
@@ -18,7 +20,7 @@ def test_get_todays_review_time_ms(mocker: MagicMock) -> None:
     # Use a predictable timestamp
     mocker.patch(
         "src.anki_review_tracker.AnkiReviewTracker._get_start_of_today_ms",
-        return_value=int(datetime(2024, 10, 8).timestamp() * 1000),
+        return_value=_FIXED_EPOCH_MS,
     )
 
     tracker = AnkiReviewTracker(mock_mw)
@@ -36,17 +38,18 @@ def test_get_todays_review_time_ms(mocker: MagicMock) -> None:
         (None, None, 0),  # mw.col is None
         ("mock_col", None, 0),  # mw.col.db is None
     ],
+    ids=["col_none", "db_none"],
 )
 def test_get_todays_review_time_ms_returns_zero_on_none_conditions(
     col_value: Optional[str], db_value: Optional[str], expected: int
 ) -> None:
-    mock_mw = MagicMock()
+    mock_mw = Mock()
 
     if col_value is None:
         mock_mw.col = None
     else:
-        mock_col = MagicMock()
-        mock_col.db = None if db_value is None else MagicMock()
+        mock_col = Mock()
+        mock_col.db = None if db_value is None else Mock()
         mock_mw.col = mock_col
 
     tracker = AnkiReviewTracker(mock_mw)
@@ -60,9 +63,9 @@ def test_anki_review_tracker_get_todays_review_time_milliseconds_with_large_valu
     None
 ):
     """Test get_todays_review_time_milliseconds with large time values."""
-    mock_mw = MagicMock()
-    mock_col = MagicMock()
-    mock_db = MagicMock()
+    mock_mw = Mock()
+    mock_col = Mock()
+    mock_db = Mock()
 
     # Test with large time value (24 hours)
     large_time_ms = 24 * 60 * 60 * 1000  # 24 hours in milliseconds
@@ -70,6 +73,7 @@ def test_anki_review_tracker_get_todays_review_time_milliseconds_with_large_valu
     mock_db.first.return_value = (1728313200001, 1000)
 
     mock_col.db = mock_db
+    mock_col.start_of_today.return_value = 1728313200  # Start of day timestamp
     mock_mw.col = mock_col
 
     tracker = AnkiReviewTracker(mock_mw)
@@ -93,6 +97,7 @@ def test_anki_review_tracker_get_todays_review_time_milliseconds_with_large_valu
         ),
         ([None, None], [0, 0], 0, 0),  # No reviews found  # No time, no count
     ],
+    ids=["has_reviews", "no_reviews"],
 )
 def test_get_todays_review_session_info_scenarios(
     db_first_side_effect: list[Optional[Tuple[int, int]]],
@@ -5,10 +5,12 @@ Unit tests for the configuration system.
 import json
 import logging
 import os
+from collections.abc import Mapping
 from typing import Any, cast
-from unittest.mock import Mock, mock_open, patch
+from unittest.mock import Mock, call, mock_open, patch
 
 import pytest
+from pytest_mock import MockerFixture
 
 from src.config import (
     CONFIG_KEY,
@@ -21,8 +23,54 @@ from src.config import (
     save_config,
     update_config_field,
 )
+from src.config_schema import CONFIG_SCHEMA
 from tests.test_constants import TEST_API_TOKEN, TEST_PROJECT_ID, TEST_WORKSPACE_ID
 
+_BASE_VALID_CONFIG: dict[str, object] = {
+    "api_token": TEST_API_TOKEN,
+    "workspace_id": str(TEST_WORKSPACE_ID),
+    "project_id": str(TEST_PROJECT_ID),
+}
+
+
+def _assert_saved(mw: Mock, key: str, cfg: object) -> None:
+    """Assert addonManager.writeConfig was called once, persisting cfg under key."""
+    assert mw.addonManager.writeConfig.call_count == 1
+    assert mw.addonManager.writeConfig.call_args == call(key, cfg)
+
+
+class DummyWidget:
+    set_called: bool
+
+    def __init__(self):
+        self.set_called = False
+
+    def setText(self, val: object) -> None:
+        self.set_called = True
+
+    def setChecked(self, val: object) -> None:
+        self.set_called = True
+
+
+class DummyDialog:
+    fields: dict[str, DummyWidget]
+
+    def __init__(self, fields: dict[str, DummyWidget]):
+        self.fields = fields
+
+    def load_config(self, config: Mapping[str, object]) -> None:
+        missing = [k for k in CONFIG_SCHEMA if k not in config]
+        if missing:
+            logging.warning(
+                f"Config being loaded into dialog is missing fields: {missing}"
+            )
+        for field_name, widget in self.fields.items():
+            value = config.get(field_name, "")
+            if hasattr(widget, "setText"):
+                widget.setText(value)
+            elif hasattr(widget, "setChecked"):
+                widget.setChecked(value)
+
 
 class TestConfig:
     """Test configuration management functions."""
@@ -48,19 +96,12 @@ class TestConfig:
         with patch("src.config.mw", mock_mw):
             config = get_config()
             assert config == DEFAULT_CONFIG.copy()
-            mock_mw.addonManager.writeConfig.assert_called_once_with(
-                CONFIG_KEY, DEFAULT_CONFIG.copy()
-            )
+            _assert_saved(mock_mw, CONFIG_KEY, DEFAULT_CONFIG.copy())
 
     @pytest.mark.unit
     def test_get_config_with_existing_config(self) -> None:
         """Test get_config when configuration exists and merges defaults for missing optionals."""
-        existing_config = {
-            "api_token": TEST_API_TOKEN,
-            "workspace_id": str(TEST_WORKSPACE_ID),
-            "project_id": str(TEST_PROJECT_ID),
-            "description": "Test Description",
-        }
+        existing_config = {**_BASE_VALID_CONFIG, "description": "Test Description"}
 
         mock_mw = Mock()
         mock_mw.addonManager.getConfig.return_value = existing_config
@@ -90,9 +131,7 @@ class TestConfig:
             with patch("src.config.CONFIG_KEY", "anki_toggl_dev"):
                 result = save_config(cast("dict[str, object]", test_config))
                 assert result is True
-                mock_mw.addonManager.writeConfig.assert_called_once_with(
-                    "anki_toggl_dev", test_config
-                )
+                _assert_saved(mock_mw, "anki_toggl_dev", test_config)
 
     @pytest.mark.unit
     def test_save_config_with_no_mw(self) -> None:
@@ -113,12 +152,7 @@ class TestConfig:
     @pytest.mark.unit
     def test_get_toggl_credentials_valid(self) -> None:
         """Test get_toggl_credentials with valid configuration."""
-        valid_config = {
-            "api_token": TEST_API_TOKEN,
-            "workspace_id": str(TEST_WORKSPACE_ID),
-            "project_id": str(TEST_PROJECT_ID),
-            "description": "Test Description",
-        }
+        valid_config = {**_BASE_VALID_CONFIG, "description": "Test Description"}
 
         with patch("src.config.get_config", return_value=valid_config):
             credentials = get_toggl_credentials()
@@ -163,27 +197,23 @@ class TestConfig:
             assert "must be integers" in error_msg
 
     @pytest.mark.unit
-    def test_is_configured_true(self) -> None:
+    def test_is_configured_true(self, mocker: MockerFixture) -> None:
         """Test is_configured when properly configured."""
-        valid_config = {
-            "api_token": TEST_API_TOKEN,
-            "workspace_id": str(TEST_WORKSPACE_ID),
-            "project_id": str(TEST_PROJECT_ID),
-        }
+        valid_config = {**_BASE_VALID_CONFIG}
 
-        with patch("src.config.get_config", return_value=valid_config):
-            assert is_configured() is True
+        mocker.patch("src.config.get_config", return_value=valid_config)
+        assert is_configured() is True
 
     @pytest.mark.unit
-    def test_is_configured_false(self) -> None:
+    def test_is_configured_false(self, mocker: MockerFixture) -> None:
         """Test is_configured when not properly configured."""
         invalid_config = {
             "api_token": TEST_API_TOKEN,
             # Missing workspace_id and project_id
         }
 
-        with patch("src.config.get_config", return_value=invalid_config):
-            assert is_configured() is False
+        mocker.patch("src.config.get_config", return_value=invalid_config)
+        assert is_configured() is False
 
     @pytest.mark.unit
     def test_reset_config(self) -> None:
@@ -207,6 +237,7 @@ class TestConfig:
                 assert result is True
                 mock_save.assert_called_once_with(updated_config)
 
+    @pytest.mark.unit
     def test_get_config_logs_key_and_contents(
         self, caplog: pytest.LogCaptureFixture
     ) -> None:
@@ -216,8 +247,9 @@ class TestConfig:
             with caplog.at_level("DEBUG"):
                 config = get_config()
                 assert config["api_token"] == "abc"
-                assert any("Using config key" in r.message for r in caplog.records)
+                assert any("Using config key" in m for m in caplog.messages)
 
+    @pytest.mark.unit
     def test_save_config_logs_key_and_contents(
         self, caplog: pytest.LogCaptureFixture
     ) -> None:
@@ -226,8 +258,9 @@ class TestConfig:
             with caplog.at_level("DEBUG"):
                 result = save_config(cast("dict[str, object]", {"api_token": "abc"}))
                 assert result is True
-                assert any("Using config key" in r.message for r in caplog.records)
+                assert any("Using config key" in m for m in caplog.messages)
 
+    @pytest.mark.unit
     def test_get_config_missing_logs_stack(
         self, caplog: pytest.LogCaptureFixture
     ) -> None:
@@ -238,10 +271,11 @@ class TestConfig:
                 config = get_config()
                 assert config == DEFAULT_CONFIG.copy()
                 assert any(
-                    "No config found; saving default config." in r.message
-                    for r in caplog.records
+                    "No config found; saving default config." in m
+                    for m in caplog.messages
                 )
 
+    @pytest.mark.unit
     def test_config_persistence_with_dynamic_key(self) -> None:
         dummy_package = "dummy_addon_package"
         dummy_config = {
@@ -285,44 +319,10 @@ class TestConfig:
                         )
                         mock_mw.addonManager.getConfig.assert_called_with(dummy_package)
 
+    @pytest.mark.unit
     def test_config_dialog_loads_all_fields_and_warns_on_missing(
         self, caplog: pytest.LogCaptureFixture
     ) -> None:
-        from collections.abc import Mapping
-
-        from src.config_schema import CONFIG_SCHEMA
-
-        class DummyDialog:
-            fields: dict[str, "DummyWidget"]
-
-            def __init__(self, fields: dict[str, "DummyWidget"]):
-                self.fields = fields
-
-            def load_config(self, config: Mapping[str, object]) -> None:
-                missing = [k for k in CONFIG_SCHEMA if k not in config]
-                if missing:
-                    logging.warning(
-                        f"Config being loaded into dialog is missing fields: {missing}"
-                    )
-                for field_name, widget in self.fields.items():
-                    value = config.get(field_name, "")
-                    if hasattr(widget, "setText"):
-                        widget.setText(value)
-                    elif hasattr(widget, "setChecked"):
-                        widget.setChecked(value)
-
-        class DummyWidget:
-            set_called: bool
-
-            def __init__(self):
-                self.set_called = False
-
-            def setText(self, val: object) -> None:
-                self.set_called = True
-
-            def setChecked(self, val: object) -> None:
-                self.set_called = True
-
         fields = {k: DummyWidget() for k in CONFIG_SCHEMA}
         dialog = DummyDialog(fields)
         # All fields present
@@ -341,6 +341,7 @@ class TestConfig:
             dialog.load_config(config_missing)
             assert any("missing fields" in r for r in caplog.text.splitlines())
 
+    @pytest.mark.unit
     def test_save_config_with_only_description(self, caplog) -> None:
         """Test saving a config dict with only 'description' field."""
         from src.config import save_config
@@ -359,6 +360,7 @@ class TestConfig:
             # Should warn about missing fields
             assert any("missing fields" in r for r in caplog.text.splitlines())
 
+    @pytest.mark.unit
     def test_save_config_with_missing_required_fields(self, caplog) -> None:
         """Test saving a config dict missing required fields triggers warning."""
         from src.config import save_config
@@ -372,6 +374,7 @@ class TestConfig:
             # Should warn about missing fields
             assert any("missing fields" in r for r in caplog.text.splitlines())
 
+    @pytest.mark.unit
     def test_save_and_load_config_with_all_fields(self, caplog) -> None:
         """Test saving and loading a config dict with all fields persists correctly."""
         from src.config import get_config, save_config
@@ -391,52 +394,38 @@ class TestConfig:
             # Should not warn about missing fields
             assert not any("missing fields" in r for r in caplog.text.splitlines())
 
+    @pytest.mark.unit
     def test_config_key_is_addon_folder_name(self) -> None:
         """Test that CONFIG_KEY is set to the add-on folder name."""
         expected = os.path.basename(os.path.dirname(os.path.abspath("src/config.py")))
         assert expected == CONFIG_KEY
 
     @pytest.mark.unit
-    def test_get_config_uses_addon_manager_mapping_key(self) -> None:
-        """get_config should resolve key via addonFromModule(__name__) when available."""
+    @pytest.mark.parametrize("op", ["read", "write"])
+    def test_config_uses_addon_manager_mapping_key(self, op: str) -> None:
+        """get_config/save_config should use the addonFromModule(__name__) key."""
         from src import config as cfg
 
         mock_mw = Mock()
         mock_mw.addonManager.addonFromModule.return_value = "addon-folder-xyz"
         # Provide a minimal valid config to avoid default-save path
-        mock_mw.addonManager.getConfig.return_value = {
-            "api_token": TEST_API_TOKEN,
-            "workspace_id": str(TEST_WORKSPACE_ID),
-            "project_id": str(TEST_PROJECT_ID),
-        }
+        mock_mw.addonManager.getConfig.return_value = {**_BASE_VALID_CONFIG}
 
         with patch("src.config.mw", mock_mw):
-            loaded = cfg.get_config()
-            assert loaded["api_token"] == TEST_API_TOKEN
-            mock_mw.addonManager.addonFromModule.assert_called_once()
-            # Should use resolved key for reads
-            mock_mw.addonManager.getConfig.assert_called_with("addon-folder-xyz")
-
-    @pytest.mark.unit
-    def test_save_config_uses_addon_manager_mapping_key(self) -> None:
-        """save_config should use addonFromModule(__name__) result for writes."""
-        from src import config as cfg
-
-        mock_mw = Mock()
-        mock_mw.addonManager.addonFromModule.return_value = "addon-folder-xyz"
-
-        config = {
-            "api_token": TEST_API_TOKEN,
-            "workspace_id": TEST_WORKSPACE_ID,
-            "project_id": TEST_PROJECT_ID,
-        }
-
-        with patch("src.config.mw", mock_mw):
-            ok = cfg.save_config(cast("dict[str, object]", config))
-            assert ok is True
-            mock_mw.addonManager.writeConfig.assert_called_with(
-                "addon-folder-xyz", config
-            )
+            if op == "read":
+                loaded = cfg.get_config()
+                assert loaded["api_token"] == TEST_API_TOKEN
+                mock_mw.addonManager.addonFromModule.assert_called_once()
+                # Should use resolved key for reads
+                mock_mw.addonManager.getConfig.assert_called_with("addon-folder-xyz")
+            else:
+                config: dict[str, object] = {
+                    "api_token": TEST_API_TOKEN,
+                    "workspace_id": TEST_WORKSPACE_ID,
+                    "project_id": TEST_PROJECT_ID,
+                }
+                assert cfg.save_config(config) is True
+                _assert_saved(mock_mw, "addon-folder-xyz", config)
 
     @pytest.mark.unit
     @pytest.mark.parametrize("returned", [None, "", Exception("boom")])
@@ -462,13 +451,12 @@ class TestConfig:
                 fallback_key, DEFAULT_CONFIG.copy()
             )
 
+    @pytest.mark.unit
     def test_get_config_uses_default_for_missing_optional_fields(self) -> None:
         from src.constants import DEFAULT_DESCRIPTION, DEFAULT_TIMEZONE
 
         existing_config = {
-            "api_token": TEST_API_TOKEN,
-            "workspace_id": str(TEST_WORKSPACE_ID),
-            "project_id": str(TEST_PROJECT_ID),
+            **_BASE_VALID_CONFIG,
             # intentionally omit description, auto_sync, timezone
         }
 
@@ -481,13 +469,12 @@ class TestConfig:
             assert config["timezone"] == DEFAULT_TIMEZONE
             assert config["auto_sync"] is False
 
+    @pytest.mark.unit
     def test_get_config_uses_default_when_description_blank(self) -> None:
         from src.constants import DEFAULT_DESCRIPTION
 
         existing_config = {
-            "api_token": TEST_API_TOKEN,
-            "workspace_id": str(TEST_WORKSPACE_ID),
-            "project_id": str(TEST_PROJECT_ID),
+            **_BASE_VALID_CONFIG,
             "description": "",  # blank should coalesce to default
         }
 
@@ -498,13 +485,12 @@ class TestConfig:
             config = get_config()
             assert config["description"] == DEFAULT_DESCRIPTION
 
+    @pytest.mark.unit
     def test_get_config_uses_default_when_timezone_blank(self) -> None:
         from src.constants import DEFAULT_TIMEZONE
 
         existing_config = {
-            "api_token": TEST_API_TOKEN,
-            "workspace_id": str(TEST_WORKSPACE_ID),
-            "project_id": str(TEST_PROJECT_ID),
+            **_BASE_VALID_CONFIG,
             "timezone": "",  # blank should coalesce to default
         }
 
@@ -534,6 +520,18 @@ class TestTimezoneConfig:
             ("America/NonExistent", False),
             ("Random/String", False),
         ],
+        ids=[
+            "utc",
+            "america_new_york",
+            "europe_london",
+            "asia_tokyo",
+            "australia_sydney",
+            "america_los_angeles",
+            "invalid_timezone",
+            "empty",
+            "america_nonexistent",
+            "random_string",
+        ],
     )
     def test_validate_timezone(self, timezone: str, expected: bool) -> None:
         """Test validate_timezone with different timezone names."""
@@ -555,6 +553,7 @@ class TestTimezoneConfig:
         result = validate_timezone(timezone_abbrev)
         assert isinstance(result, bool), f"'{timezone_abbrev}' should return a boolean"
 
+    @pytest.mark.unit
     def test_get_common_timezones(self) -> None:
         """Test get_common_timezones returns expected timezone list."""
         from src.timezone import get_common_timezones
@@ -2,11 +2,31 @@
 
 import json
 from pathlib import Path
+from typing import Any
 
 import pytest
 
 from src.config import DEFAULT_CONFIG
 
+_SRC = Path(__file__).resolve().parent.parent / "src"
+_CONFIG_JSON = _SRC / "config.json"
+_CONFIG_MD = _SRC / "config.md"
+
+_DEFAULT_VALUE_CHECKS = [
+    ("api_token", ""),
+    ("workspace_id", 0),
+    ("project_id", 0),
+    ("description", "anki"),
+    ("auto_sync", False),
+    ("timezone", "UTC"),
+]
+
+
+@pytest.fixture(scope="session")
+def config_json_data() -> Any:
+    """Read and parse src/config.json once per test session."""
+    return json.loads(_CONFIG_JSON.read_bytes())
+
 
 class TestConfigJson:
     """Test config.json file for Anki add-on compatibility."""
@@ -14,61 +34,34 @@ class TestConfigJson:
     @pytest.mark.unit
     def test_config_json_exists(self):
         """Test that config.json file exists in src directory."""
-        config_json_path = Path(__file__).parent.parent / "src" / "config.json"
-        assert config_json_path.exists(), (
+        assert _CONFIG_JSON.exists(), (
             "config.json file is required for Anki add-on config system"
         )
 
     @pytest.mark.unit
     def test_config_json_valid_json(self):
         """Test that config.json contains valid JSON."""
-        config_json_path = Path(__file__).parent.parent / "src" / "config.json"
-        try:
-            with open(config_json_path) as f:
-                json.load(f)
-        except json.JSONDecodeError as e:
-            pytest.fail(f"config.json contains invalid JSON: {e}")
+        json.loads(_CONFIG_JSON.read_bytes())
 
     @pytest.mark.unit
-    def test_config_json_matches_defaults(self):
+    def test_config_json_matches_defaults(self, config_json_data):
         """Test that config.json contains the same fields as DEFAULT_CONFIG."""
-        config_json_path = Path(__file__).parent.parent / "src" / "config.json"
-
-        with open(config_json_path) as f:
-            config_json = json.load(f)
-
-        # Check that all DEFAULT_CONFIG keys are present in config.json
-        for key in DEFAULT_CONFIG:
-            assert key in config_json, f"config.json missing required key: {key}"
-
-        # Check that config.json doesn't have extra keys
-        for key in config_json:
-            assert key in DEFAULT_CONFIG, f"config.json has unexpected key: {key}"
+        missing = set(DEFAULT_CONFIG) - set(config_json_data)
+        extra = set(config_json_data) - set(DEFAULT_CONFIG)
+        assert not missing and not extra, f"missing={missing}, extra={extra}"
 
     @pytest.mark.unit
-    def test_config_json_default_values(self):
-        """Test that config.json has expected default values."""
-        config_json_path = Path(__file__).parent.parent / "src" / "config.json"
-
-        with open(config_json_path) as f:
-            config_json = json.load(f)
-
-        # Test specific default values
-        assert config_json["api_token"] == "", (
-            "API token should default to empty string"
-        )
-        assert config_json["workspace_id"] == 0, "Workspace ID should default to 0"
-        assert config_json["project_id"] == 0, "Project ID should default to 0"
-        assert config_json["description"] == "anki", (
-            "Description should have default value"
+    @pytest.mark.parametrize("key,expected", _DEFAULT_VALUE_CHECKS)
+    def test_config_json_default_value(self, config_json_data, key, expected):
+        """Test that config.json has the expected default value for each key."""
+        assert config_json_data[key] == expected, (
+            f"{key} should default to {expected!r}"
         )
-        assert config_json["auto_sync"] is False, "Auto sync should default to False"
-        assert config_json["timezone"] == "UTC", "Timezone should default to UTC"
+        assert type(config_json_data[key]) is type(expected)
 
     @pytest.mark.unit
     def test_config_md_exists(self):
         """Test that config.md documentation file exists."""
-        config_md_path = Path(__file__).parent.parent / "src" / "config.md"
-        assert config_md_path.exists(), (
+        assert _CONFIG_MD.exists(), (
             "config.md file provides user documentation for configuration"
         )
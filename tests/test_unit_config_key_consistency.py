@@ -1,86 +1,98 @@
 """Test config key consistency fix."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
+import pytest
+
+from src import config as _cfg
 from src.config import _resolve_config_key
 
 
+def _make_mw(return_value=None, side_effect=None):
+    """Build a mw stub whose addonManager.addonFromModule is preconfigured."""
+    mw = Mock()
+    afm = mw.addonManager.addonFromModule
+    if side_effect is not None:
+        afm.side_effect = side_effect
+    else:
+        afm.return_value = return_value
+    return mw
+
+
 class TestConfigKeyConsistency:
     """Test that config key resolution is consistent."""
 
     def setup_method(self):
         """Reset config key cache before each test."""
-        # Reset cache by writing directly
-        import src.config as cfg
+        _cfg._cached_config_key = None  # type: ignore[attr-defined]
 
-        cfg._cached_config_key = None  # type: ignore[attr-defined]
+    @pytest.fixture
+    def install_mw(self, monkeypatch):
+        """Return a callable that patches src.config.mw with a _make_mw stub."""
 
-    def test_config_key_is_cached_and_consistent(self):
+        def install(return_value=None, side_effect=None):
+            mw = _make_mw(return_value, side_effect)
+            monkeypatch.setattr(_cfg, "mw", mw)
+            return mw
+
+        return install
+
+    def test_config_key_is_cached_and_consistent(self, install_mw):
         """Test that config key is cached and returns same value on multiple calls."""
-        mock_mw = Mock()
-        mock_mw.addonManager.addonFromModule.return_value = "test_addon_key"
+        mock_mw = install_mw("test_addon_key")
 
-        with patch("src.config.mw", mock_mw):
-            # First call should resolve and cache the key
-            key1 = _resolve_config_key()
+        # First call should resolve and cache the key
+        key1 = _resolve_config_key()
 
-            # Second call should return cached value
-            key2 = _resolve_config_key()
+        # Second call should return cached value
+        key2 = _resolve_config_key()
 
-            # Both should be the same
-            assert key1 == key2 == "test_addon_key"
+        # Both should be the same
+        assert key1 == key2 == "test_addon_key"
 
-            # addonFromModule should only be called once (first time)
-            assert mock_mw.addonManager.addonFromModule.call_count == 1
+        # addonFromModule should only be called once (first time)
+        assert mock_mw.addonManager.addonFromModule.call_count == 1
 
-    def test_config_key_fallback_is_cached(self):
+    def test_config_key_fallback_is_cached(self, install_mw):
         """Test that fallback config key is also cached."""
-        mock_mw = Mock()
-        mock_mw.addonManager.addonFromModule.side_effect = Exception(
-            "Failed to resolve"
-        )
+        mock_mw = install_mw(side_effect=Exception("Failed to resolve"))
 
-        with patch("src.config.mw", mock_mw):
-            # First call should use fallback and cache it
-            key1 = _resolve_config_key()
+        # First call should use fallback and cache it
+        key1 = _resolve_config_key()
 
-            # Second call should return cached value
-            key2 = _resolve_config_key()
+        # Second call should return cached value
+        key2 = _resolve_config_key()
 
-            # Both should be the same (fallback value)
-            assert key1 == key2
-            assert key1 == "src"  # CONFIG_KEY fallback
+        # Both should be the same (fallback value)
+        assert key1 == key2
+        assert key1 == "src"  # CONFIG_KEY fallback
 
-            # addonFromModule should only be called once
-            assert mock_mw.addonManager.addonFromModule.call_count == 1
+        # addonFromModule should only be called once
+        assert mock_mw.addonManager.addonFromModule.call_count == 1
 
-    def test_config_key_no_mw_returns_fallback(self):
+    def test_config_key_no_mw_returns_fallback(self, monkeypatch):
         """Test config key resolution when mw is None."""
-        with patch("src.config.mw", None):
-            key = _resolve_config_key()
-            assert key == "src"  # CONFIG_KEY fallback
+        monkeypatch.setattr(_cfg, "mw", None)
+        key = _resolve_config_key()
+        assert key == "src"  # CONFIG_KEY fallback
 
-    def test_reset_config_key_cache_works(self):
+    def test_reset_config_key_cache_works(self, install_mw):
         """Test that resetting cache allows re-resolution."""
-        mock_mw = Mock()
-        mock_mw.addonManager.addonFromModule.return_value = "test_addon_key"
-
-        with patch("src.config.mw", mock_mw):
-            # First resolution
-            key1 = _resolve_config_key()
-            assert key1 == "test_addon_key"
+        mock_mw = install_mw("test_addon_key")
 
-            # Reset cache
-            import src.config as cfg
+        # First resolution
+        key1 = _resolve_config_key()
+        assert key1 == "test_addon_key"
 
-            cfg._cached_config_key = None  # type: ignore[attr-defined]
+        # Reset cache
+        _cfg._cached_config_key = None  # type: ignore[attr-defined]
 
-            # Change mock return value
-            mock_mw.addonManager.addonFromModule.return_value = "different_key"
+        # Change mock return value
+        mock_mw.addonManager.addonFromModule.return_value = "different_key"
 
-            # Second resolution should get new value
-            key2 = _resolve_config_key()
-            assert key2 == "different_key"
+        # Second resolution should get new value
+        key2 = _resolve_config_key()
+        assert key2 == "different_key"
 
-            # Should have been called twice now
-            assert mock_mw.addonManager.addonFromModule.call_count == 2
+        # Should have been called twice now
+        assert mock_mw.addonManager.addonFromModule.call_count == 2
@@ -1,9 +1,12 @@
+import logging
+from collections.abc import Callable, Mapping
 from datetime import datetime, timezone
 from typing import Any, Optional
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock
 
 import pytest
 
+import src.core as core
 from src.constants import HTTP_BAD_REQUEST, HTTP_OK, HTTP_SERVICE_UNAVAILABLE
 from src.core import (
     SyncSession,
@@ -14,6 +17,7 @@ from src.core import (
     validate_session,
 )
 from src.timezone import Timezone
+from tests.conftest import UpdateCall
 from tests.test_constants import (
     TEST_CORE_DESCRIPTION,
     TEST_CORE_PROJECT_ID,
@@ -24,130 +28,162 @@ from tests.test_constants import (
     TEST_SESSION_COUNT,
 )
 
+_CORE_LOGGER = "anki_toggl.core"
 
-@pytest.mark.unit
-def test_sync_review_time_to_toggl_success(
-    monkeypatch: pytest.MonkeyPatch,
+_TZ_SEOUL = Timezone("Asia/Seoul")
+_TZ_UTC = Timezone("UTC")
+
+_EARLY_MORNING = datetime(2023, 1, 18, 8, 0, 0, tzinfo=timezone.utc)
+_MORNING = datetime(2023, 1, 18, 9, 0, 0, tzinfo=timezone.utc)
+_MORNING_END = datetime(2023, 1, 18, 10, 0, 0, tzinfo=timezone.utc)
+_AFTERNOON = datetime(2023, 1, 18, 15, 30, 0, tzinfo=timezone.utc)
+_MOCK_FIRST = datetime(2023, 1, 15, 9, 0, 0, tzinfo=timezone.utc)
+_MOCK_LAST = datetime(2023, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
+_MOCK_FIRST_MS = int(_MOCK_FIRST.timestamp() * 1000)
+_MOCK_LAST_MS = int(_MOCK_LAST.timestamp() * 1000)
+# Stands in for "now" wherever a test only needs some valid aware timestamp.
+_FROZEN_NOW = datetime(2023, 1, 18, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class StubSyncManager:
+    """SyncStateManager stand-in with canned lookups that records record_sync calls."""
+
+    def __init__(
+        self, has_synced: bool = False, entry: Optional[dict[str, Any]] = None
+    ) -> None:
+        self._has_synced = has_synced
+        self._entry = entry
+        self.record_sync_calls: list[dict[str, Any]] = []
+
+    def has_been_synced(self, *args: Any, **kwargs: Any) -> bool:
+        return self._has_synced
+
+    def get_synced_entry(self, *args: Any, **kwargs: Any) -> Optional[dict[str, Any]]:
+        return self._entry
+
+    def record_sync(self, *args: Any, **kwargs: Any) -> None:
+        self.record_sync_calls.append(kwargs)
+
+
+class _TrackerStub:
+    """AnkiReviewTracker stand-in that returns a fixed session-info mapping."""
+
+    __slots__ = ("_info",)
+
+    def __init__(self, info: Mapping[str, Any]) -> None:
+        self._info = info
+
+    def get_todays_review_session_info(self) -> Mapping[str, Any]:
+        return self._info
+
+
+@pytest.fixture
+def creator(request: pytest.FixtureRequest) -> type[Any]:
+    """Resolve the TogglTrackEntryCreator stand-in named by an indirect parameter."""
+    return request.getfixturevalue(request.param)
+
+
+@pytest.fixture
+def patch_core(monkeypatch: pytest.MonkeyPatch) -> Callable[..., None]:
+    """Return a helper that patches src.core attributes given as keyword arguments."""
+
+    def apply(**attrs: Any) -> None:
+        for name, value in attrs.items():
+            monkeypatch.setattr(core, name, value)
+
+    return apply
+
+
+@pytest.fixture
+def patched_sync_deps(
+    patch_core: Callable[..., None],
     mock_anki_mw: MagicMock,
-    sample_session_info: dict[str, Any],
+    sample_session_info: Mapping[str, Any],
     mock_sync_state_manager: MagicMock,
-    mock_toggl_creator: MagicMock,
     mock_anki_review_tracker: MagicMock,
 ) -> None:
-    # Use shared fixtures instead of local mocks
-    monkeypatch.setattr("src.core.mw", mock_anki_mw)
-    monkeypatch.setattr("src.core.TogglTrackEntryCreator", mock_toggl_creator)
-    monkeypatch.setattr(
-        "src.core.AnkiReviewTracker", mock_anki_review_tracker(sample_session_info)
-    )
-    monkeypatch.setattr(
-        "src.core.SyncStateManager",
-        lambda: mock_sync_state_manager,  # type: ignore
+    """Patch src.core with the shared mw, review tracker and sync state manager."""
+    patch_core(
+        mw=mock_anki_mw,
+        AnkiReviewTracker=mock_anki_review_tracker(sample_session_info),
+        SyncStateManager=lambda: mock_sync_state_manager,
     )
 
-    response = sync_review_time_to_toggl(
-        TEST_CORE_TOKEN,
-        TEST_CORE_WORKSPACE_ID,
-        TEST_CORE_PROJECT_ID,
-        TEST_CORE_DESCRIPTION,
-    )
-
-    assert response is not None
-    assert response.status_code == HTTP_OK
-
 
 @pytest.mark.unit
 @pytest.mark.parametrize(
-    "timezone_str,expected_status",
+    "creator,timezone_obj,expected_status,expected_text",
     [
-        (None, HTTP_OK),
-        ("Asia/Seoul", HTTP_OK),
+        ("mock_toggl_creator", None, HTTP_OK, None),
+        ("mock_toggl_creator", _TZ_SEOUL, HTTP_OK, None),
+        ("mock_toggl_creator_error", None, HTTP_BAD_REQUEST, "Bad Request"),
+        (
+            "network_error_toggl_creator",
+            None,
+            HTTP_SERVICE_UNAVAILABLE,
+            "Network error: Network connection failed",
+        ),
     ],
+    ids=["success", "success_seoul", "api_error", "network_error"],
+    indirect=["creator"],
 )
-def test_sync_review_time_to_toggl_success_scenarios(
-    monkeypatch: pytest.MonkeyPatch,
-    mock_anki_mw: MagicMock,
-    sample_session_info: dict[str, Any],
-    mock_sync_state_manager: MagicMock,
-    mock_toggl_creator: MagicMock,
-    mock_anki_review_tracker: MagicMock,
-    timezone_str: Optional[str],
+def test_sync_review_time_to_toggl_outcomes(
+    patch_core: Callable[..., None],
+    patched_sync_deps: None,
+    creator: type[Any],
+    timezone_obj: Optional[Timezone],
     expected_status: int,
+    expected_text: Optional[str],
 ) -> None:
-    # Use shared fixtures for testing different timezone scenarios
-    monkeypatch.setattr("src.core.mw", mock_anki_mw)
-    monkeypatch.setattr("src.core.TogglTrackEntryCreator", mock_toggl_creator)
-    monkeypatch.setattr(
-        "src.core.AnkiReviewTracker", mock_anki_review_tracker(sample_session_info)
-    )
-    monkeypatch.setattr(
-        "src.core.SyncStateManager",
-        lambda: mock_sync_state_manager,  # type: ignore
-    )
-
-    from src.timezone import Timezone
+    patch_core(TogglTrackEntryCreator=creator)
+
+    if expected_status >= HTTP_BAD_REQUEST:
+        with pytest.raises(TogglSyncError) as exc_info:
+            sync_review_time_to_toggl(
+                TEST_CORE_TOKEN,
+                TEST_CORE_WORKSPACE_ID,
+                TEST_CORE_PROJECT_ID,
+                TEST_CORE_DESCRIPTION,
+                timezone_obj,
+            )
+        # Verify specific error attributes
+        assert exc_info.value.status_code == expected_status
+        assert expected_text in exc_info.value.response_text
+        return
 
-    timezone_obj = Timezone(timezone_str) if timezone_str else None
-    response = sync_review_time_to_toggl("token", 1, 2, "desc", timezone_obj)
+    response = sync_review_time_to_toggl(
+        TEST_CORE_TOKEN,
+        TEST_CORE_WORKSPACE_ID,
+        TEST_CORE_PROJECT_ID,
+        TEST_CORE_DESCRIPTION,
+        timezone_obj,
+    )
 
     assert response is not None
     assert response.status_code == expected_status
 
 
-@pytest.mark.unit
-def test_sync_review_time_to_toggl_error(
-    monkeypatch: pytest.MonkeyPatch,
-    mock_anki_mw: MagicMock,
-    sample_session_info: dict[str, Any],
-    mock_sync_state_manager: MagicMock,
-    mock_toggl_creator_error: MagicMock,
-    mock_anki_review_tracker: MagicMock,
-) -> None:
-    # Use shared fixtures for error testing
-    monkeypatch.setattr("src.core.mw", mock_anki_mw)
-    monkeypatch.setattr("src.core.TogglTrackEntryCreator", mock_toggl_creator_error)
-    monkeypatch.setattr(
-        "src.core.AnkiReviewTracker", mock_anki_review_tracker(sample_session_info)
-    )
-    monkeypatch.setattr(
-        "src.core.SyncStateManager",
-        lambda: mock_sync_state_manager,  # type: ignore
-    )
-
-    with pytest.raises(TogglSyncError) as exc_info:
-        sync_review_time_to_toggl("token", 1, 2, "desc")
-
-    # Verify specific error attributes
-    assert exc_info.value.status_code == HTTP_BAD_REQUEST
-    assert "Bad Request" in exc_info.value.response_text
-
-
 @pytest.mark.unit
 def test_sync_review_time_to_toggl_no_review_time(
-    monkeypatch: pytest.MonkeyPatch,
+    patch_core: Callable[..., None],
     mock_anki_mw: MagicMock,
-    empty_session_info: dict[str, Any],
+    empty_session_info: Mapping[str, Any],
     mock_sync_state_manager: MagicMock,
     mock_toggl_creator_with_tracking: MagicMock,
     mock_anki_review_tracker: MagicMock,
 ) -> None:
     # Use shared fixtures for no review time testing
-    monkeypatch.setattr("src.core.mw", mock_anki_mw)
-    monkeypatch.setattr(
-        "src.core.TogglTrackEntryCreator", mock_toggl_creator_with_tracking
-    )
-    monkeypatch.setattr(
-        "src.core.AnkiReviewTracker", mock_anki_review_tracker(empty_session_info)
-    )
-    monkeypatch.setattr(
-        "src.core.SyncStateManager",
-        lambda: mock_sync_state_manager,  # type: ignore
+    patch_core(
+        mw=mock_anki_mw,
+        TogglTrackEntryCreator=mock_toggl_creator_with_tracking,
+        AnkiReviewTracker=mock_anki_review_tracker(empty_session_info),
+        SyncStateManager=lambda: mock_sync_state_manager,
     )
 
     # Patch get_review_session to return a zero-duration session
     def get_zero_duration_session(mw: Any, tz: str) -> SyncSession:
         return SyncSession(
-            start_time=datetime.now(timezone.utc),
+            start_time=_FROZEN_NOW,
             end_time=None,
             duration_seconds=0,
             session_count=0,
@@ -155,9 +191,8 @@ def test_sync_review_time_to_toggl_no_review_time(
             last_review_time=None,
         )
 
-    monkeypatch.setattr(
-        "src.core.get_review_session",
-        get_zero_duration_session,
+    patch_core(
+        get_review_session=get_zero_duration_session,
     )
 
     mock_toggl_creator_with_tracking.called = False
@@ -181,16 +216,16 @@ def test_sync_review_time_to_toggl_no_review_time(
     ],
 )
 def test_sync_review_time_to_toggl_no_mw_or_collection(
-    monkeypatch: pytest.MonkeyPatch,
+    patch_core: Callable[..., None],
     mock_anki_mw_no_collection: MagicMock,
     mw_value: Optional[str],
     expected_response: None,
 ) -> None:
     if mw_value is None:
-        monkeypatch.setattr("src.core.mw", None)
+        patch_core(mw=None)
     else:
         # Use shared fixture for testing when Anki collection is None
-        monkeypatch.setattr("src.core.mw", mock_anki_mw_no_collection)
+        patch_core(mw=mock_anki_mw_no_collection)
 
     response = sync_review_time_to_toggl(
         TEST_CORE_TOKEN,
@@ -204,67 +239,33 @@ def test_sync_review_time_to_toggl_no_mw_or_collection(
 
 @pytest.mark.unit
 def test_sync_review_time_to_toggl_uses_fallback_timezone(
-    monkeypatch: pytest.MonkeyPatch, mock_anki_mw: MagicMock, mock_response_factory: Any
+    patch_core: Callable[..., None],
+    mock_anki_mw: MagicMock,
+    mock_response_factory: Any,
+    dummy_toggl_creator: type[Any],
 ) -> None:
     mock_mw = mock_anki_mw
-    monkeypatch.setattr("src.core.mw", mock_mw)
-
-    class DummyResponse:
-        status_code: int = 200
-        text: str = "OK"
-
-    class DummyTogglCreator:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
-
-        def create_entry(
-            self,
-            start_time: datetime,
-            duration: int,
-            timezone_str: Optional[str] = None,
-        ) -> DummyResponse:
-            return DummyResponse()
-
-        def create_or_update_entry(
-            self,
-            start_time: datetime,
-            duration: int,
-            timezone_str: Optional[str] = None,
-        ) -> DummyResponse:
-            return DummyResponse()
-
-        def update_entry(
-            self,
-            entry_id: int,
-            duration: int,
-            start_time: datetime,
-            timezone_str: Optional[str] = None,
-        ) -> DummyResponse:
-            return DummyResponse()
+    patch_core(mw=mock_mw)
 
     # Mock session info with no first review time (to trigger fallback)
     mock_session_info = {
         "first_review_time": None,
-        "last_review_time": datetime(2023, 1, 15, 10, 0, 0, tzinfo=timezone.utc),
+        "last_review_time": _MOCK_LAST,
         "total_duration_ms": TEST_DURATION_1_MIN_MS,
         "session_count": TEST_SESSION_COUNT,
     }
 
     # Create a fresh sync state manager for this test
-
-    mock_sync_manager = Mock()
-    mock_sync_manager.has_been_synced.return_value = False
-    mock_sync_manager.record_sync.return_value = None
+    mock_sync_manager = StubSyncManager()
 
     # Mock get_timezone_config to return a specific timezone
-    monkeypatch.setattr("src.core.get_timezone", lambda: Timezone("Asia/Seoul"))
+    patch_core(get_timezone=lambda: _TZ_SEOUL)
 
-    monkeypatch.setattr("src.core.TogglTrackEntryCreator", DummyTogglCreator)
-    monkeypatch.setattr(
-        "src.core.AnkiReviewTracker",
-        lambda mw: MagicMock(get_todays_review_session_info=lambda: mock_session_info),
+    patch_core(
+        TogglTrackEntryCreator=dummy_toggl_creator,
+        AnkiReviewTracker=lambda mw: _TrackerStub(mock_session_info),
+        SyncStateManager=lambda: mock_sync_manager,
     )
-    monkeypatch.setattr("src.core.SyncStateManager", lambda: mock_sync_manager)
 
     response = sync_review_time_to_toggl(
         TEST_CORE_TOKEN,
@@ -279,69 +280,36 @@ def test_sync_review_time_to_toggl_uses_fallback_timezone(
 
 @pytest.mark.unit
 def test_sync_review_time_to_toggl_prevents_duplicates(
-    monkeypatch: pytest.MonkeyPatch, mock_anki_mw: MagicMock
+    patch_core: Callable[..., None],
+    mock_anki_mw: MagicMock,
+    dummy_toggl_creator: type[Any],
 ) -> None:
     """Test that sync_review_time_to_toggl prevents duplicate entries."""
     mock_mw = mock_anki_mw
-    monkeypatch.setattr("src.core.mw", mock_mw)
-
-    class DummyResponse:
-        status_code: int = 200
-        text: str = "OK"
-
-    class DummyTogglCreator:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
-
-        def create_entry(
-            self,
-            start_time: datetime,
-            duration: int,
-            timezone_str: Optional[str] = None,
-        ) -> DummyResponse:
-            return DummyResponse()
-
-        def create_or_update_entry(
-            self,
-            start_time: datetime,
-            duration: int,
-            timezone_str: Optional[str] = None,
-        ) -> DummyResponse:
-            return DummyResponse()
-
-        def update_entry(
-            self,
-            entry_id: int,
-            duration: int,
-            start_time: datetime,
-            timezone_str: Optional[str] = None,
-        ) -> DummyResponse:
-            return DummyResponse()
+    patch_core(mw=mock_mw)
 
     # Mock session info
     mock_session_info = {
-        "first_review_time": datetime(2023, 1, 18, 9, 0, 0, tzinfo=timezone.utc),
-        "last_review_time": datetime(2023, 1, 18, 10, 0, 0, tzinfo=timezone.utc),
+        "first_review_time": _MORNING,
+        "last_review_time": _MORNING_END,
         "total_duration_ms": TEST_DURATION_1_MIN_MS,
         "session_count": TEST_SESSION_COUNT,
     }
 
     # Create a sync state manager that indicates entry already exists
+    mock_sync_manager = StubSyncManager(
+        has_synced=True,
+        entry={
+            "duration_seconds": 60,  # Same duration
+            "toggl_id": 12345,
+        },
+    )
 
-    mock_sync_manager = Mock()
-    mock_sync_manager.has_been_synced.return_value = True
-    mock_sync_manager.get_synced_entry.return_value = {
-        "duration_seconds": 60,  # Same duration
-        "toggl_id": 12345,
-    }
-    mock_sync_manager.record_sync.return_value = None
-
-    monkeypatch.setattr("src.core.TogglTrackEntryCreator", DummyTogglCreator)
-    monkeypatch.setattr(
-        "src.core.AnkiReviewTracker",
-        lambda mw: MagicMock(get_todays_review_session_info=lambda: mock_session_info),
+    patch_core(
+        TogglTrackEntryCreator=dummy_toggl_creator,
+        AnkiReviewTracker=lambda mw: _TrackerStub(mock_session_info),
+        SyncStateManager=lambda: mock_sync_manager,
     )
-    monkeypatch.setattr("src.core.SyncStateManager", lambda: mock_sync_manager)
 
     # This should perform an update to prevent duplicate entries
     response = sync_review_time_to_toggl(
@@ -355,107 +323,56 @@ def test_sync_review_time_to_toggl_prevents_duplicates(
     assert response.status_code == HTTP_OK
 
 
-def test_sync_preserves_original_start_time_on_update(
-    monkeypatch: pytest.MonkeyPatch, mock_anki_mw: MagicMock
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "synced_entry,expected_start",
+    [
+        (
+            {
+                "duration_seconds": 60,
+                "toggl_id": 12345,
+                "start_time": _EARLY_MORNING.isoformat(),
+            },
+            _EARLY_MORNING,
+        ),
+        # Missing "start_time" falls back to the current session start
+        ({"duration_seconds": 1800, "toggl_id": 12345}, _MORNING),
+    ],
+    ids=["preserves_original", "fallback_to_session"],
+)
+def test_sync_update_start_time(
+    patch_core: Callable[..., None],
+    mock_anki_mw: MagicMock,
+    capturing_toggl_creator: type[Any],
+    captured_update_calls: list[UpdateCall],
+    synced_entry: dict[str, Any],
+    expected_start: datetime,
 ) -> None:
-    """Test that when updating an existing entry, the original start time is preserved."""
-    mock_mw = mock_anki_mw
-    monkeypatch.setattr("src.core.mw", mock_mw)
-
-    # Track what start_time was passed to update_entry
-    captured_update_calls = []
-
-    class DummyResponse:
-        status_code: int = 200
-        text: str = "OK"
-
-        def json(self) -> dict[str, Any]:
-            return {"id": 12345}
-
-    class DummyTogglCreator:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
-
-        def create_entry(
-            self,
-            start_time: datetime,
-            duration: int,
-            timezone_str: Optional[str] = None,
-        ) -> DummyResponse:
-            return DummyResponse()
-
-        def create_or_update_entry(
-            self,
-            start_time: datetime,
-            duration: int,
-            timezone_str: Optional[str] = None,
-        ) -> DummyResponse:
-            return DummyResponse()
-
-        def update_entry(
-            self,
-            entry_id: int,
-            duration: int,
-            start_time: datetime,
-            timezone_str: Optional[str] = None,
-        ) -> DummyResponse:
-            # Capture the call for verification
-            captured_update_calls.append(
-                {
-                    "entry_id": entry_id,
-                    "duration": duration,
-                    "start_time": start_time,
-                    "timezone_str": timezone_str,
-                }
-            )
-            return DummyResponse()
-
-    # Mock session info - afternoon session with morning first_review_time
-    morning_start = datetime(2023, 1, 18, 9, 0, 0, tzinfo=timezone.utc)
-    afternoon_end = datetime(2023, 1, 18, 15, 30, 0, tzinfo=timezone.utc)
-
+    """Test the start time sent when updating an already-synced entry."""
+    # Afternoon session whose first review happened in the morning
     mock_session_info = {
-        "first_review_time": morning_start,  # This is from morning session
-        "last_review_time": afternoon_end,  # This is from afternoon session
+        "first_review_time": _MORNING,
+        "last_review_time": _AFTERNOON,
         "total_duration_ms": 3600000,  # 1 hour total (updated duration)
         "session_count": 20,
     }
-
-    # Original start time from the first sync (should be preserved)
-    original_start_time = datetime(2023, 1, 18, 9, 0, 0, tzinfo=timezone.utc)
-
-    # Create a sync state manager that indicates entry already exists
-
-    mock_sync_manager = Mock()
-    mock_sync_manager.has_been_synced.return_value = True
-    # Patch get_review_session to return a session with duration_seconds=3600
-    monkeypatch.setattr(
-        "src.core.get_review_session",
-        lambda mw, tz: SyncSession(
-            start_time=morning_start,
-            end_time=afternoon_end,
+    mock_sync_manager = StubSyncManager(has_synced=True, entry=synced_entry)
+
+    patch_core(
+        mw=mock_anki_mw,
+        TogglTrackEntryCreator=capturing_toggl_creator,
+        AnkiReviewTracker=lambda mw: _TrackerStub(mock_session_info),
+        SyncStateManager=lambda: mock_sync_manager,
+        get_review_session=lambda mw, tz: SyncSession(
+            start_time=_MORNING,
+            end_time=_AFTERNOON,
             duration_seconds=3600,
             session_count=20,
-            first_review_time=morning_start,
-            last_review_time=afternoon_end,
+            first_review_time=_MORNING,
+            last_review_time=_AFTERNOON,
         ),
     )
-    # Set previous duration to 60 (difference is 3540 > 5)
-    mock_sync_manager.get_synced_entry.return_value = {
-        "duration_seconds": 60,
-        "toggl_id": 12345,
-        "start_time": original_start_time.isoformat(),
-    }
-    mock_sync_manager.record_sync.return_value = None
 
-    monkeypatch.setattr("src.core.TogglTrackEntryCreator", DummyTogglCreator)
-    monkeypatch.setattr(
-        "src.core.AnkiReviewTracker",
-        lambda mw: MagicMock(get_todays_review_session_info=lambda: mock_session_info),
-    )
-    monkeypatch.setattr("src.core.SyncStateManager", lambda: mock_sync_manager)
-
-    # Perform the sync
     response = sync_review_time_to_toggl(
         TEST_CORE_TOKEN,
         TEST_CORE_WORKSPACE_ID,
@@ -463,167 +380,58 @@ def test_sync_preserves_original_start_time_on_update(
         TEST_CORE_DESCRIPTION,
     )
 
-    # Verify the response was successful
     assert response is not None
     assert response.status_code == HTTP_OK
 
-    # Verify that update_entry was called exactly once
+    # update_entry is called exactly once with the updated duration
     assert len(captured_update_calls) == 1
-
-    # Verify that the original start time was preserved (not the new first_review_time)
     update_call = captured_update_calls[0]
-    assert update_call["entry_id"] == 12345
-    assert update_call["duration"] == 3600  # Updated duration
-    assert (
-        update_call["start_time"] == original_start_time
-    )  # PRESERVED original start time
-
-    # Verify that record_sync was called with the preserved start time
-    mock_sync_manager.record_sync.assert_called_once()
-    record_call_args = mock_sync_manager.record_sync.call_args[1]
-    assert record_call_args["start_time"] == original_start_time
+    assert update_call.entry_id == 12345
+    assert update_call.duration == 3600
+    assert update_call.start_time == expected_start
+
+    assert len(mock_sync_manager.record_sync_calls) == 1
+    record_call_args = mock_sync_manager.record_sync_calls[0]
+    # The sync state always records the current session start
+    assert record_call_args["start_time"] == _MORNING
     assert record_call_args["duration_seconds"] == 3600
     assert record_call_args["action"] == "update"
 
 
-def test_sync_fallback_start_time_when_no_original(
-    monkeypatch: pytest.MonkeyPatch, mock_anki_mw: MagicMock
-) -> None:
-    """Test fallback behavior when original start time is not available."""
-    mock_mw = mock_anki_mw
-    monkeypatch.setattr("src.core.mw", mock_mw)
-
-    # Track what start_time was passed to update_entry
-    captured_update_calls = []
-
-    class DummyResponse:
-        status_code: int = 200
-        text: str = "OK"
-
-        def json(self) -> dict[str, Any]:
-            return {"id": 12345}
-
-    class DummyTogglCreator:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
-
-        def update_entry(
-            self,
-            entry_id: int,
-            duration: int,
-            start_time: datetime,
-            timezone_str: Optional[str] = None,
-        ) -> DummyResponse:
-            captured_update_calls.append(
-                {
-                    "entry_id": entry_id,
-                    "duration": duration,
-                    "start_time": start_time,
-                    "timezone_str": timezone_str,
-                }
-            )
-            return DummyResponse()
-
-    # Mock session info
-    current_start = datetime(2023, 1, 18, 9, 0, 0, tzinfo=timezone.utc)
-    last_review_time = datetime(2023, 1, 18, 10, 0, 0, tzinfo=timezone.utc)
-    mock_session_info = {
-        "first_review_time": current_start,
-        "last_review_time": last_review_time,
-        "total_duration_ms": 3600000,  # 1 hour
-        "session_count": 20,
-    }
-
-    # Create sync state manager with existing entry but NO start_time field
-
-    mock_sync_manager = Mock()
-    mock_sync_manager.has_been_synced.return_value = True
-    mock_sync_manager.get_synced_entry.return_value = {
-        "duration_seconds": 1800,
-        "toggl_id": 12345,
-        # Missing "start_time" field to test fallback
-    }
-    mock_sync_manager.record_sync.return_value = None
-
-    monkeypatch.setattr("src.core.TogglTrackEntryCreator", DummyTogglCreator)
-    monkeypatch.setattr(
-        "src.core.AnkiReviewTracker",
-        lambda mw: MagicMock(get_todays_review_session_info=lambda: mock_session_info),
-    )
-    monkeypatch.setattr("src.core.SyncStateManager", lambda: mock_sync_manager)
-
-    # Patch get_review_session to return a session with duration_seconds=3600
-    monkeypatch.setattr(
-        "src.core.get_review_session",
-        lambda mw, tz: SyncSession(
-            start_time=current_start,
-            end_time=last_review_time,
-            duration_seconds=3600,
-            session_count=20,
-            first_review_time=current_start,
-            last_review_time=last_review_time,
-        ),
-    )
-    # Perform the sync
-    response = sync_review_time_to_toggl(
-        TEST_CORE_TOKEN,
-        TEST_CORE_WORKSPACE_ID,
-        TEST_CORE_PROJECT_ID,
-        TEST_CORE_DESCRIPTION,
-    )
-
-    # Verify the response was successful
-    assert response is not None
-    assert response.status_code == HTTP_OK
-
-    # Verify that update_entry was called
-    assert len(captured_update_calls) == 1
-
-    # Should fall back to current start time (from session info)
-    update_call = captured_update_calls[0]
-    assert update_call["duration"] == 3600
-    assert update_call["start_time"] == current_start
-
-
 @pytest.mark.unit
 def test_get_review_session_returns_syncsession(
-    monkeypatch: pytest.MonkeyPatch,
+    patch_core: Callable[..., None],
 ) -> None:
     mock_mw = MagicMock()
-    mock_first_review = datetime(2023, 1, 15, 9, 0, 0, tzinfo=timezone.utc)
-    mock_last_review = datetime(2023, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
     mock_session_info = {
-        "first_review_time": mock_first_review,
-        "last_review_time": mock_last_review,
+        "first_review_time": _MOCK_FIRST,
+        "last_review_time": _MOCK_LAST,
         "total_duration_ms": TEST_DURATION_1_MIN_MS,
         "session_count": TEST_SESSION_COUNT,
     }
     # Patch AnkiReviewTracker to return our mock_session_info
-    monkeypatch.setattr(
-        "src.core.AnkiReviewTracker",
-        lambda mw: MagicMock(get_todays_review_session_info=lambda: mock_session_info),
-    )
+    patch_core(AnkiReviewTracker=lambda mw: _TrackerStub(mock_session_info))
     # Patch mock_mw.col.db.scalar to return 60000 for session_count and 10 for total_duration_ms
     mock_col = MagicMock()
     mock_col.db.scalar.side_effect = [60000, 10]
     # Patch mock_mw.col.db.first to return correct timestamps for first and last review
     mock_col.db.first.side_effect = [
-        (int(mock_first_review.timestamp() * 1000), 0),
-        (int(mock_last_review.timestamp() * 1000), 0),
+        (_MOCK_FIRST_MS, 0),
+        (_MOCK_LAST_MS, 0),
     ]
     mock_mw.col = mock_col
-    session = get_review_session(mock_mw, Timezone("UTC"))
+    session = get_review_session(mock_mw, _TZ_UTC)
     assert isinstance(session, SyncSession)
     assert session.duration_seconds == TEST_DURATION_1_MIN
     assert session.session_count == TEST_SESSION_COUNT
-    assert session.first_review_time == mock_first_review
-    assert session.last_review_time == mock_last_review
+    assert session.first_review_time == _MOCK_FIRST
+    assert session.last_review_time == _MOCK_LAST
 
 
 @pytest.mark.unit
 def test_validate_session_zero_duration_raises(monkeypatch: pytest.MonkeyPatch) -> None:
     session = SyncSession(
-        start_time=datetime.now(timezone.utc),
+        start_time=_FROZEN_NOW,
         end_time=None,
         duration_seconds=0,
         session_count=0,
@@ -640,7 +448,7 @@ def test_validate_session_allows_resync_when_requested(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     session = SyncSession(
-        start_time=datetime.now(timezone.utc),
+        start_time=_FROZEN_NOW,
         end_time=None,
         duration_seconds=60,
         session_count=1,
@@ -653,44 +461,8 @@ def test_validate_session_allows_resync_when_requested(
     validate_session(session, mock_sync_manager, 1, 2, "desc")
 
 
-def test_sync_review_time_to_toggl_network_error(
-    monkeypatch: pytest.MonkeyPatch,
-    mock_anki_mw: MagicMock,
-    sample_session_info: dict[str, Any],
-    mock_sync_state_manager: MagicMock,
-    mock_anki_review_tracker: MagicMock,
-) -> None:
-    """Test network error handling with specific RequestException."""
-    import requests
-
-    # Mock TogglTrackEntryCreator to raise network error
-    class NetworkErrorTogglCreator:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
-
-        def create_entry(
-            self, start_time: Any, duration: Any, timezone_str: Any = None
-        ) -> None:
-            raise requests.ConnectionError("Network connection failed")
-
-    monkeypatch.setattr("src.core.mw", mock_anki_mw)
-    monkeypatch.setattr("src.core.TogglTrackEntryCreator", NetworkErrorTogglCreator)
-    monkeypatch.setattr(
-        "src.core.AnkiReviewTracker", mock_anki_review_tracker(sample_session_info)
-    )
-    monkeypatch.setattr("src.core.SyncStateManager", lambda: mock_sync_state_manager)
-
-    with pytest.raises(TogglSyncError) as exc_info:
-        sync_review_time_to_toggl("token", 1, 2, "desc")
-
-    # Verify it's a network error specifically
-    assert exc_info.value.status_code == HTTP_SERVICE_UNAVAILABLE
-    assert "Network error" in exc_info.value.response_text
-    assert "Network connection failed" in exc_info.value.response_text
-
-
 def test_sync_review_time_to_toggl_invalid_input_error(
-    monkeypatch: pytest.MonkeyPatch,
+    patch_core: Callable[..., None],
     mock_anki_mw: MagicMock,
 ) -> None:
     """Test handling of invalid input with specific ValueError."""
@@ -702,8 +474,7 @@ def test_sync_review_time_to_toggl_invalid_input_error(
 
         return MagicMock(get_todays_review_session_info=get_session_info)
 
-    monkeypatch.setattr("src.core.mw", mock_anki_mw)
-    monkeypatch.setattr("src.core.AnkiReviewTracker", mock_review_tracker_invalid)
+    patch_core(mw=mock_anki_mw, AnkiReviewTracker=mock_review_tracker_invalid)
 
     with pytest.raises(TogglSyncError) as exc_info:
         sync_review_time_to_toggl("token", 1, 2, "desc")
@@ -715,29 +486,21 @@ def test_sync_review_time_to_toggl_invalid_input_error(
 
 
 def test_sync_review_time_to_toggl_logs_correctly(
-    monkeypatch: pytest.MonkeyPatch,
-    mock_anki_mw: MagicMock,
-    sample_session_info: dict[str, Any],
-    mock_sync_state_manager: MagicMock,
+    patch_core: Callable[..., None],
+    patched_sync_deps: None,
     mock_toggl_creator: MagicMock,
-    mock_anki_review_tracker: MagicMock,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test that sync_review_time_to_toggl logs correctly at different levels."""
-    monkeypatch.setattr("src.core.mw", mock_anki_mw)
-    monkeypatch.setattr("src.core.TogglTrackEntryCreator", mock_toggl_creator)
-    monkeypatch.setattr(
-        "src.core.AnkiReviewTracker", mock_anki_review_tracker(sample_session_info)
+    patch_core(TogglTrackEntryCreator=mock_toggl_creator)
+
+    caplog.set_level(logging.DEBUG, logger=_CORE_LOGGER)
+    response = sync_review_time_to_toggl(
+        TEST_CORE_TOKEN,
+        TEST_CORE_WORKSPACE_ID,
+        TEST_CORE_PROJECT_ID,
+        TEST_CORE_DESCRIPTION,
     )
-    monkeypatch.setattr("src.core.SyncStateManager", lambda: mock_sync_state_manager)
-
-    with caplog.at_level("DEBUG"):
-        response = sync_review_time_to_toggl(
-            TEST_CORE_TOKEN,
-            TEST_CORE_WORKSPACE_ID,
-            TEST_CORE_PROJECT_ID,
-            TEST_CORE_DESCRIPTION,
-        )
 
     # Check that INFO level messages are logged
     info_messages = [record for record in caplog.records if record.levelname == "INFO"]
@@ -760,36 +523,17 @@ def test_sync_review_time_to_toggl_logs_correctly(
 
 
 def test_sync_review_time_to_toggl_logs_error_correctly(
-    monkeypatch: pytest.MonkeyPatch,
-    mock_anki_mw: MagicMock,
-    sample_session_info: dict[str, Any],
-    mock_sync_state_manager: MagicMock,
-    mock_anki_review_tracker: MagicMock,
+    patch_core: Callable[..., None],
+    patched_sync_deps: None,
+    network_error_toggl_creator: type[Any],
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test that errors are logged correctly with ERROR level."""
-    import requests
-
-    # Mock TogglTrackEntryCreator to raise network error
-    class NetworkErrorTogglCreator:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
-
-        def create_entry(
-            self, start_time: Any, duration: Any, timezone_str: Any = None
-        ) -> None:
-            raise requests.ConnectionError("Network connection failed")
-
-    monkeypatch.setattr("src.core.mw", mock_anki_mw)
-    monkeypatch.setattr("src.core.TogglTrackEntryCreator", NetworkErrorTogglCreator)
-    monkeypatch.setattr(
-        "src.core.AnkiReviewTracker", mock_anki_review_tracker(sample_session_info)
-    )
-    monkeypatch.setattr("src.core.SyncStateManager", lambda: mock_sync_state_manager)
+    patch_core(TogglTrackEntryCreator=network_error_toggl_creator)
 
-    with caplog.at_level("ERROR"):
-        with pytest.raises(TogglSyncError):
-            sync_review_time_to_toggl("token", 1, 2, "desc")
+    caplog.set_level(logging.ERROR, logger=_CORE_LOGGER)
+    with pytest.raises(TogglSyncError):
+        sync_review_time_to_toggl("token", 1, 2, "desc")
 
     # Check that ERROR level messages are logged
     error_messages = [
@@ -807,26 +551,26 @@ def test_sync_review_time_to_toggl_logs_error_correctly(
 
 
 def test_sync_review_time_to_toggl_logs_skip_correctly(
-    monkeypatch: pytest.MonkeyPatch,
+    patch_core: Callable[..., None],
     mock_anki_mw: MagicMock,
-    empty_session_info: dict[str, Any],
+    empty_session_info: Mapping[str, Any],
     mock_sync_state_manager: MagicMock,
     mock_toggl_creator: MagicMock,
     mock_anki_review_tracker: MagicMock,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test that skipped syncs are logged correctly with INFO level."""
-    monkeypatch.setattr("src.core.mw", mock_anki_mw)
-    monkeypatch.setattr("src.core.TogglTrackEntryCreator", mock_toggl_creator)
-    monkeypatch.setattr(
-        "src.core.AnkiReviewTracker", mock_anki_review_tracker(empty_session_info)
+    patch_core(
+        mw=mock_anki_mw,
+        TogglTrackEntryCreator=mock_toggl_creator,
+        AnkiReviewTracker=mock_anki_review_tracker(empty_session_info),
+        SyncStateManager=lambda: mock_sync_state_manager,
     )
-    monkeypatch.setattr("src.core.SyncStateManager", lambda: mock_sync_state_manager)
 
     # Patch get_review_session to return a zero-duration session
     def get_zero_duration_session(mw: Any, tz: Any) -> SyncSession:
         return SyncSession(
-            start_time=datetime.now(timezone.utc),
+            start_time=_FROZEN_NOW,
             end_time=None,
             duration_seconds=0,
             session_count=0,
@@ -834,15 +578,15 @@ def test_sync_review_time_to_toggl_logs_skip_correctly(
             last_review_time=None,
         )
 
-    monkeypatch.setattr("src.core.get_review_session", get_zero_duration_session)
+    patch_core(get_review_session=get_zero_duration_session)
 
-    with caplog.at_level("INFO"):
-        response = sync_review_time_to_toggl(
-            TEST_CORE_TOKEN,
-            TEST_CORE_WORKSPACE_ID,
-            TEST_CORE_PROJECT_ID,
-            TEST_CORE_DESCRIPTION,
-        )
+    caplog.set_level(logging.INFO, logger=_CORE_LOGGER)
+    response = sync_review_time_to_toggl(
+        TEST_CORE_TOKEN,
+        TEST_CORE_WORKSPACE_ID,
+        TEST_CORE_PROJECT_ID,
+        TEST_CORE_DESCRIPTION,
+    )
 
     # Check that INFO level skip message is logged
     info_messages = [record for record in caplog.records if record.levelname == "INFO"]
@@ -1,16 +1,23 @@
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock
 
 import pytest
 
+from src.core import (
+    SyncSession,
+    SyncSkipped,
+    _prepare_timezone,
+    _validate_anki_environment,
+    sync_to_toggl,
+)
+from src.timezone import Timezone
+
 
 @pytest.mark.unit
 def test_validate_anki_environment_raises_when_mw_none(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    from src.core import SyncSkipped, _validate_anki_environment
-
     monkeypatch.setattr("src.core.mw", None)
     with pytest.raises(SyncSkipped):
         _validate_anki_environment()
@@ -20,10 +27,7 @@ def test_validate_anki_environment_raises_when_mw_none(
 def test_validate_anki_environment_raises_when_collection_none(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    from src.core import SyncSkipped, _validate_anki_environment
-
-    mock_mw = MagicMock()
-    mock_mw.col = None
+    mock_mw = SimpleNamespace(col=None)
     monkeypatch.setattr("src.core.mw", mock_mw)
     with pytest.raises(SyncSkipped):
         _validate_anki_environment()
@@ -31,23 +35,17 @@ def test_validate_anki_environment_raises_when_collection_none(
 
 @pytest.mark.unit
 def test_prepare_timezone_uses_get_timezone_when_none(
-    monkeypatch: pytest.MonkeyPatch,
+    monkeypatch: pytest.MonkeyPatch, utc_tz: Timezone
 ) -> None:
-    from src.core import _prepare_timezone
-    from src.timezone import Timezone
-
-    tz_obj = Timezone("UTC")
-    monkeypatch.setattr("src.core.get_timezone", lambda: tz_obj)
+    monkeypatch.setattr("src.core.get_timezone", lambda: utc_tz)
     result = _prepare_timezone(None)
-    assert result is tz_obj
+    assert result is utc_tz
 
 
 @pytest.mark.unit
 def test_sync_to_toggl_missing_id_and_json_error(
     monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
 ) -> None:
-    from src.core import SyncSession, sync_to_toggl
-
     session = SyncSession(
         start_time=datetime.now(timezone.utc),
         end_time=None,
@@ -58,28 +56,20 @@ def test_sync_to_toggl_missing_id_and_json_error(
     )
 
     # Mock state manager to capture record_sync
-    from typing import Any as _Any
-    from typing import Protocol
-
-    class _StateProto(Protocol):
-        def has_been_synced(self, *a: Any, **k: Any) -> bool: ...
-        def get_synced_entry(self, *a: Any, **k: Any) -> dict[str, Any]: ...
-        def record_sync(self, *a: Any, **k: Any) -> None: ...
-
     class DummyState:
         def __init__(self) -> None:
-            self.calls: list[dict[str, _Any]] = []
+            self.calls: list[dict[str, Any]] = []
 
-        def has_been_synced(self, *a: _Any, **k: _Any) -> bool:
+        def has_been_synced(self, *a: Any, **k: Any) -> bool:
             return False
 
-        def get_synced_entry(self, *a: _Any, **k: _Any) -> dict[str, _Any]:
+        def get_synced_entry(self, *a: Any, **k: Any) -> dict[str, Any]:
             return {}
 
-        def record_sync(self, *a: _Any, **k: _Any) -> None:
+        def record_sync(self, *a: Any, **k: Any) -> None:
             self.calls.append(k)
 
-    dummy_state: _StateProto = DummyState()
+    dummy_state = DummyState()
 
     class RespNoId:
         status_code = 200
@@ -95,12 +85,9 @@ def test_sync_to_toggl_missing_id_and_json_error(
 
     # First scenario: json() returns dict without id
     monkeypatch.setattr("src.core._create_toggl_entry", lambda *a, **k: RespNoId())
-    from typing import cast
-
-    from src.sync_state_manager import SyncStateManager
 
     with caplog.at_level("DEBUG"):
-        tz_obj = MagicMock()
+        tz_obj = SimpleNamespace(name="UTC")
         resp = sync_to_toggl(
             session,
             "tok",
@@ -108,18 +95,18 @@ def test_sync_to_toggl_missing_id_and_json_error(
             2,
             "d",
             tz_obj,
-            cast("SyncStateManager", cast("object", dummy_state)),
+            dummy_state,  # type: ignore[arg-type]
         )
     assert resp.status_code == 200
-    assert (
-        any("Failed to extract toggl_id" not in r.message for r in caplog.records)
-        or True
+    assert not any(
+        r.getMessage().startswith("Failed to extract toggl_id") for r in caplog.records
     )
     assert len(dummy_state.calls) == 1
     assert dummy_state.calls[0]["toggl_id"] is None
 
     # Second scenario: json() raises
     dummy_state.calls.clear()
+    caplog.clear()
     monkeypatch.setattr(
         "src.core._create_toggl_entry", lambda *a, **k: RespJsonRaises()
     )
@@ -131,9 +118,13 @@ def test_sync_to_toggl_missing_id_and_json_error(
             2,
             "d",
             tz_obj,
-            cast("SyncStateManager", cast("object", dummy_state)),
+            dummy_state,  # type: ignore[arg-type]
         )
     assert resp2.status_code == 200
+    assert any(
+        r.getMessage() == "Failed to extract toggl_id from response: bad json"
+        for r in caplog.records
+    )
     # Ensure record_sync still called with toggl_id None
     assert len(dummy_state.calls) == 1
     assert dummy_state.calls[0]["toggl_id"] is None
@@ -1,115 +1,105 @@
-from typing import Any
-from unittest.mock import MagicMock
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType, ModuleType, SimpleNamespace
+from typing import Any, Optional
+from unittest.mock import patch
 
 import pytest
 
+from src.core import TogglSyncError
+from tests.conftest import FakeResponse
 
-@pytest.mark.unit
-def test_sync_to_toggl_success_uses_show_tooltip(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    import src.__init__ as init_mod
+_CREDS = MappingProxyType(
+    {"api_token": "tok", "workspace_id": 1, "project_id": 2, "description": "desc"}
+)
 
-    # Arrange
-    monkeypatch.setattr(init_mod, "require_mw", lambda: MagicMock())
-    monkeypatch.setattr(init_mod, "is_configured", lambda: True)
-    monkeypatch.setattr(
-        init_mod,
-        "get_toggl_credentials",
-        lambda: {
-            "api_token": "tok",
-            "workspace_id": 1,
-            "project_id": 2,
-            "description": "desc",
-        },
-    )
 
-    class DummyResponse:
-        status_code = 200
-        text = "OK"
+@dataclass
+class InitEnv:
+    """Patched src.__init__ module plus hooks to override its collaborators."""
 
-    monkeypatch.setattr(init_mod, "get_timezone", lambda: MagicMock(name="UTC"))
-    monkeypatch.setattr(
-        init_mod, "sync_review_time_to_toggl", lambda *a, **k: DummyResponse()
-    )
+    mod: ModuleType
+    calls: list[tuple[tuple[Any, ...], dict[str, Any]]]
+    set_credentials: Callable[[Optional[Mapping[str, Any]]], None]
+    set_sync_fn: Callable[[Callable[..., Any]], None]
+
+
+@pytest.fixture(scope="session")
+def init_mod() -> ModuleType:
+    """Import the add-on entry module once per test session."""
+    import src.__init__ as init_mod
 
+    return init_mod
+
+
+@pytest.fixture
+def init_env(
+    init_mod: ModuleType, dummy_toggl_response: FakeResponse
+) -> Iterator[InitEnv]:
+    """Patch src.__init__ for a configured, successful sync and record tooltips."""
     calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
 
     def fake_show_tooltip(message: str, parent: Any = None) -> None:
         calls.append(((message,), {"parent": parent}))
 
-    monkeypatch.setattr(init_mod, "show_tooltip", fake_show_tooltip)
+    # Overrides are plain setattr calls: patch.multiple restores every attribute
+    # it patched on exit, including ones reassigned inside the block.
+    def set_credentials(credentials: Optional[Mapping[str, Any]]) -> None:
+        init_mod.get_toggl_credentials = lambda: credentials
+
+    def set_sync_fn(fn: Callable[..., Any]) -> None:
+        init_mod.sync_review_time_to_toggl = fn
+
+    with patch.multiple(
+        init_mod,
+        require_mw=lambda: SimpleNamespace(),
+        is_configured=lambda: True,
+        get_timezone=lambda: SimpleNamespace(name="UTC"),
+        show_tooltip=fake_show_tooltip,
+        get_toggl_credentials=lambda: _CREDS,
+        sync_review_time_to_toggl=lambda *a, **k: dummy_toggl_response,
+    ):
+        yield InitEnv(init_mod, calls, set_credentials, set_sync_fn)
+
 
+@pytest.mark.unit
+def test_sync_to_toggl_success_uses_show_tooltip(init_env: InitEnv) -> None:
     # Act
-    init_mod.sync_to_toggl()
+    init_env.mod.sync_to_toggl()
 
     # Assert
     assert any(
-        "Successfully synced review time to Toggl" in args[0] for (args, _) in calls
+        "Successfully synced review time to Toggl" in args[0]
+        for (args, _) in init_env.calls
     )
 
 
 @pytest.mark.unit
-def test_sync_to_toggl_failure_uses_show_tooltip(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    import src.__init__ as init_mod
-    from src.core import TogglSyncError
-
+def test_sync_to_toggl_failure_uses_show_tooltip(init_env: InitEnv) -> None:
     # Arrange
-    monkeypatch.setattr(init_mod, "require_mw", lambda: MagicMock())
-    monkeypatch.setattr(init_mod, "is_configured", lambda: True)
-    monkeypatch.setattr(
-        init_mod,
-        "get_toggl_credentials",
-        lambda: {
-            "api_token": "tok",
-            "workspace_id": 1,
-            "project_id": 2,
-            "description": "desc",
-        },
-    )
-    monkeypatch.setattr(init_mod, "get_timezone", lambda: MagicMock(name="UTC"))
-
     def raise_sync_error(*a: Any, **k: Any) -> None:
         raise TogglSyncError(500, "server boom")
 
-    monkeypatch.setattr(init_mod, "sync_review_time_to_toggl", raise_sync_error)
-
-    calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
-
-    def fake_show_tooltip(message: str, parent: Any = None) -> None:
-        calls.append(((message,), {"parent": parent}))
-
-    monkeypatch.setattr(init_mod, "show_tooltip", fake_show_tooltip)
+    init_env.set_sync_fn(raise_sync_error)
 
     # Act
-    init_mod.sync_to_toggl()
+    init_env.mod.sync_to_toggl()
 
     # Assert
-    assert any("Sync failed" in args[0] for (args, _) in calls)
+    assert any("Sync failed" in args[0] for (args, _) in init_env.calls)
 
 
 @pytest.mark.unit
 def test_sync_to_toggl_missing_credentials_uses_show_tooltip(
-    monkeypatch: pytest.MonkeyPatch,
+    init_env: InitEnv,
 ) -> None:
-    import src.__init__ as init_mod
-
     # Arrange
-    monkeypatch.setattr(init_mod, "require_mw", lambda: MagicMock())
-    monkeypatch.setattr(init_mod, "is_configured", lambda: True)
-    monkeypatch.setattr(init_mod, "get_toggl_credentials", lambda: None)
-
-    calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
-
-    def fake_show_tooltip(message: str, parent: Any = None) -> None:
-        calls.append(((message,), {"parent": parent}))
-
-    monkeypatch.setattr(init_mod, "show_tooltip", fake_show_tooltip)
+    init_env.set_credentials(None)
 
     # Act
-    init_mod.sync_to_toggl()
+    init_env.mod.sync_to_toggl()
 
     # Assert
-    assert any("Failed to get Toggl credentials" in args[0] for (args, _) in calls)
+    assert any(
+        "Failed to get Toggl credentials" in args[0] for (args, _) in init_env.calls
+    )
@@ -1,58 +1,37 @@
-from typing import Any
+import logging
+from types import MappingProxyType
+from typing import Any, Optional
 
 import pytest
 
+from src.config import ConfigValidationError
+from src.constants import CONFIG_AUTO_SYNC
+from src.core import TogglSyncError
+from src.sync_manager import SyncManager
 
-@pytest.mark.unit
-def test_setup_hooks_registers_on_anki_sync(monkeypatch: pytest.MonkeyPatch) -> None:
-    from src.sync_manager import SyncManager
-
-    calls: dict[str, Any] = {"called": False}
+_CREDS = MappingProxyType(
+    {"api_token": "tok", "workspace_id": 1, "project_id": 2, "description": "d"}
+)
 
-    class DummyGuiHooks:
-        def __init__(self) -> None:
-            self.sync_did_finish: list[Any] = []
 
-    dummy_hooks = DummyGuiHooks()
-    sm = SyncManager()
+def _has_record(caplog: pytest.LogCaptureFixture, level: int, prefix: str) -> bool:
+    """Return whether a record at or above level has a message starting with prefix."""
+    records = (r for r in caplog.records if r.levelno >= level)
+    return any(r.getMessage().startswith(prefix) for r in records)
 
-    # Replace gui_hooks with dummy
-    monkeypatch.setattr("src.sync_manager.gui_hooks", dummy_hooks)
 
-    # Spy on _perform_sync_if_configured to ensure the bound method works if invoked
-    def spy(_event: str) -> None:
-        calls["called"] = True
+@pytest.fixture(autouse=True)
+def _caplog_debug(caplog: pytest.LogCaptureFixture) -> None:
+    """Capture DEBUG records for every test in this module."""
+    caplog.set_level("DEBUG")
 
-    monkeypatch.setattr(sm, "_perform_sync_if_configured", spy)
-
-    sm.setup_hooks()
-
-    assert len(dummy_hooks.sync_did_finish) == 1
-    # Invoke the hook to ensure the bound method is correct
-    dummy_hooks.sync_did_finish[0]()
-    assert calls["called"] is True
-
-
-@pytest.mark.unit
-def test_perform_sync_if_configured_skips_when_disabled(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    from src.constants import CONFIG_AUTO_SYNC
-    from src.sync_manager import SyncManager
 
-    sm = SyncManager()
-
-    # Mock mw as available
-    monkeypatch.setattr("src.anki_env.get_mw_or_none", lambda: "dummy_mw")
-
-    # Auto-sync disabled
-    monkeypatch.setattr(
-        "src.sync_manager.get_config", lambda: {CONFIG_AUTO_SYNC: False}
-    )
-    # Ensure no background thread is created
+@pytest.fixture
+def inline_thread(monkeypatch: pytest.MonkeyPatch) -> dict[str, bool]:
+    """Replace threading.Thread in src.sync_manager with one that runs inline."""
     created = {"thread": False}
 
-    class DummyThread:
+    class InlineThread:
         def __init__(self, target=None, daemon=False) -> None:
             created["thread"] = True
             self.target = target
@@ -62,104 +41,89 @@ def test_perform_sync_if_configured_skips_when_disabled(
             if self.target:
                 self.target()
 
-    monkeypatch.setattr("src.sync_manager.threading.Thread", DummyThread)
-
-    sm._perform_sync_if_configured("Test")
-    assert created["thread"] is False
+    monkeypatch.setattr("src.sync_manager.threading.Thread", InlineThread)
+    return created
 
 
 @pytest.mark.unit
-def test_perform_sync_if_configured_warns_when_not_configured(
-    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
-) -> None:
-    from src.constants import CONFIG_AUTO_SYNC
-    from src.sync_manager import SyncManager
-
-    sm = SyncManager()
-
-    # Mock mw as available
-    monkeypatch.setattr("src.anki_env.get_mw_or_none", lambda: "dummy_mw")
+def test_setup_hooks_registers_on_anki_sync(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: dict[str, Any] = {"called": False}
 
-    monkeypatch.setattr("src.sync_manager.get_config", lambda: {CONFIG_AUTO_SYNC: True})
-    monkeypatch.setattr("src.sync_manager.is_configured", lambda: False)
+    class DummyGuiHooks:
+        def __init__(self) -> None:
+            self.sync_did_finish: list[Any] = []
 
-    created = {"thread": False}
+    dummy_hooks = DummyGuiHooks()
+    sm = SyncManager()
 
-    class DummyThread:
-        def __init__(self, target=None, daemon=False) -> None:
-            created["thread"] = True
-            self.target = target
-            self.daemon = daemon
+    # Replace gui_hooks with dummy
+    monkeypatch.setattr("src.sync_manager.gui_hooks", dummy_hooks)
 
-        def start(self) -> None:
-            if self.target:
-                self.target()
+    # Spy on _perform_sync_if_configured to ensure the bound method works if invoked
+    def spy(_event: str) -> None:
+        calls["called"] = True
 
-    monkeypatch.setattr("src.sync_manager.threading.Thread", DummyThread)
+    monkeypatch.setattr(sm, "_perform_sync_if_configured", spy)
 
-    with caplog.at_level("DEBUG"):
-        sm._perform_sync_if_configured("Test")
+    sm.setup_hooks()
 
-    assert created["thread"] is False
-    assert any("Toggl not configured" in r.message for r in caplog.records)
+    assert len(dummy_hooks.sync_did_finish) == 1
+    # Invoke the hook to ensure the bound method is correct
+    dummy_hooks.sync_did_finish[0]()
+    assert calls["called"] is True
 
 
 @pytest.mark.unit
-def test_perform_sync_if_configured_starts_background_thread(
+@pytest.mark.parametrize(
+    "mw,auto_sync,configured,expect_thread,log_fragment",
+    [
+        (None, True, True, False, "Anki main window not available"),
+        ("dummy_mw", False, True, False, "Auto-sync is disabled"),
+        ("dummy_mw", True, False, False, "Toggl not configured"),
+        ("dummy_mw", True, True, True, None),
+    ],
+    ids=["mw_unavailable", "disabled", "not_configured", "starts_thread"],
+)
+def test_perform_sync_if_configured(
     monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+    inline_thread: dict[str, bool],
+    mw: Optional[str],
+    auto_sync: bool,
+    configured: bool,
+    expect_thread: bool,
+    log_fragment: Optional[str],
 ) -> None:
-    from src.constants import CONFIG_AUTO_SYNC
-    from src.sync_manager import SyncManager
-
     sm = SyncManager()
 
-    # Mock mw as available
-    monkeypatch.setattr("src.anki_env.get_mw_or_none", lambda: "dummy_mw")
-
-    monkeypatch.setattr("src.sync_manager.get_config", lambda: {CONFIG_AUTO_SYNC: True})
-    monkeypatch.setattr("src.sync_manager.is_configured", lambda: True)
-
-    called = {"auto": False}
+    monkeypatch.setattr("src.anki_env.get_mw_or_none", lambda: mw)
     monkeypatch.setattr(
-        sm, "_perform_auto_sync", lambda: called.__setitem__("auto", True)
+        "src.sync_manager.get_config", lambda: {CONFIG_AUTO_SYNC: auto_sync}
     )
+    monkeypatch.setattr("src.sync_manager.is_configured", lambda: configured)
 
-    class DummyThread:
-        def __init__(self, target=None, daemon=False) -> None:
-            self.target = target
-            self.daemon = daemon
-
-        def start(self) -> None:
-            if self.target:
-                self.target()
-
-    monkeypatch.setattr("src.sync_manager.threading.Thread", DummyThread)
+    auto_synced: list[bool] = []
+    monkeypatch.setattr(sm, "_perform_auto_sync", lambda: auto_synced.append(True))
 
     sm._perform_sync_if_configured("Test")
-    assert called["auto"] is True
+
+    assert inline_thread["thread"] is expect_thread
+    assert bool(auto_synced) is expect_thread
+    if log_fragment is not None:
+        assert _has_record(caplog, logging.DEBUG, log_fragment)
 
 
 @pytest.mark.unit
 def test_perform_auto_sync_success(
     monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
 ) -> None:
-    from src.sync_manager import SyncManager
-
     sm = SyncManager()
 
     # Mock mw as available
     monkeypatch.setattr("src.anki_env.get_mw_or_none", lambda: "dummy_mw")
 
     # Provide credentials and timezone
-    monkeypatch.setattr(
-        "src.sync_manager.get_toggl_credentials",
-        lambda: {
-            "api_token": "tok",
-            "workspace_id": 1,
-            "project_id": 2,
-            "description": "d",
-        },
-    )
+    monkeypatch.setattr("src.sync_manager.get_toggl_credentials", lambda: _CREDS)
     monkeypatch.setattr("src.sync_manager.get_timezone", lambda: "UTC")
 
     class DummyResp:
@@ -170,52 +134,38 @@ def test_perform_auto_sync_success(
         "src.sync_manager.sync_review_time_to_toggl", lambda *a, **k: DummyResp()
     )
 
-    with caplog.at_level("INFO"):
-        sm._perform_auto_sync()
+    sm._perform_auto_sync()
 
-    assert any("Successfully synced review time" in r.message for r in caplog.records)
+    assert _has_record(
+        caplog, logging.INFO, "Auto-sync: Successfully synced review time"
+    )
 
 
 @pytest.mark.unit
 def test_perform_auto_sync_handles_toggl_sync_error(
     monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
 ) -> None:
-    from src.core import TogglSyncError
-    from src.sync_manager import SyncManager
-
     sm = SyncManager()
 
     # Mock mw as available
     monkeypatch.setattr("src.anki_env.get_mw_or_none", lambda: "dummy_mw")
 
-    monkeypatch.setattr(
-        "src.sync_manager.get_toggl_credentials",
-        lambda: {
-            "api_token": "tok",
-            "workspace_id": 1,
-            "project_id": 2,
-            "description": "d",
-        },
-    )
+    monkeypatch.setattr("src.sync_manager.get_toggl_credentials", lambda: _CREDS)
     monkeypatch.setattr("src.sync_manager.get_timezone", lambda: "UTC")
     monkeypatch.setattr(
         "src.sync_manager.sync_review_time_to_toggl",
         lambda *a, **k: (_ for _ in ()).throw(TogglSyncError(503, "boom")),
     )
 
-    with caplog.at_level("ERROR"):
-        sm._perform_auto_sync()
+    sm._perform_auto_sync()
 
-    assert any("Network error during auto-sync" in r.message for r in caplog.records)
+    assert _has_record(caplog, logging.ERROR, "Network error during auto-sync")
 
 
 @pytest.mark.unit
 def test_perform_auto_sync_handles_config_validation_error(
     monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
 ) -> None:
-    from src.config import ConfigValidationError
-    from src.sync_manager import SyncManager
-
     sm = SyncManager()
 
     # Mock mw as available
@@ -227,43 +177,22 @@ def test_perform_auto_sync_handles_config_validation_error(
         lambda: (_ for _ in ()).throw(ConfigValidationError("bad config")),
     )
 
-    with caplog.at_level("ERROR"):
-        sm._perform_auto_sync()
+    sm._perform_auto_sync()
 
-    assert any("ConfigValidationError" in r.message for r in caplog.records)
-
-
-@pytest.mark.unit
-def test_perform_sync_if_configured_skips_when_mw_unavailable(
-    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
-) -> None:
-    from src.sync_manager import SyncManager
-
-    sm = SyncManager()
-
-    # Mock mw as NOT available
-    monkeypatch.setattr("src.anki_env.get_mw_or_none", lambda: None)
-
-    with caplog.at_level("DEBUG"):
-        sm._perform_sync_if_configured("Test")
-
-    assert any("Anki main window not available" in r.message for r in caplog.records)
+    assert _has_record(caplog, logging.ERROR, "Auto-sync: ConfigValidationError")
 
 
 @pytest.mark.unit
 def test_perform_auto_sync_aborts_when_mw_unavailable(
     monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
 ) -> None:
-    from src.sync_manager import SyncManager
-
     sm = SyncManager()
 
     # Mock mw as NOT available
     monkeypatch.setattr("src.anki_env.get_mw_or_none", lambda: None)
 
-    with caplog.at_level("DEBUG"):
-        sm._perform_auto_sync()
+    sm._perform_auto_sync()
 
-    assert any(
-        "Anki main window no longer available" in r.message for r in caplog.records
+    assert _has_record(
+        caplog, logging.DEBUG, "Auto-sync: Anki main window no longer available"
     )
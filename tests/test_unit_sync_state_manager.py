@@ -2,49 +2,125 @@
 Unit tests for the sync state manager.
 """
 
-from datetime import date, datetime, timedelta
+import copy
+import pickle
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 
 from src.sync_state_manager import SyncStateManager
 
+_SEEDED_DATE = date(2023, 12, 25)
+
+
+@pytest.fixture(autouse=True)
+def _no_disk_save(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Skip state file writes unless the test is marked as checking persistence."""
+    if request.node.get_closest_marker("persist") is None:
+        monkeypatch.setattr(SyncStateManager, "_save_synced_entries", lambda self: None)
+
+
+@pytest.fixture(scope="session")
+def _sync_manager_template(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> SyncStateManager:
+    """Build one empty sync state manager to copy for each test."""
+    state_file = tmp_path_factory.mktemp("sync_state_template") / "sync_state.json"
+    return SyncStateManager(state_file=state_file)
+
 
 @pytest.fixture
-def sync_manager(tmp_path: Path) -> SyncStateManager:
-    """Create a sync state manager with a temporary state file."""
+def sync_manager(
+    _sync_manager_template: SyncStateManager, tmp_path: Path
+) -> SyncStateManager:
+    """Create a sync state manager with empty state and a temporary state file."""
     state_dir = tmp_path / "sync_state"
     state_dir.mkdir(exist_ok=True)
-    state_file = state_dir / "sync_state.json"
-    return SyncStateManager(state_file=state_file)
+    manager = copy.copy(_sync_manager_template)
+    manager._synced_entries = {}
+    manager.state_file = state_dir / "sync_state.json"
+    return manager
+
+
+@pytest.fixture(scope="session")
+def _shared_sync_manager(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> SyncStateManager:
+    """Build one sync state manager whose state file is reused across tests."""
+    state_dir = tmp_path_factory.mktemp("sync_state", numbered=False)
+    return SyncStateManager(state_file=state_dir / "sync_state.json")
+
+
+@pytest.fixture
+def sync_manager_shared(
+    _shared_sync_manager: SyncStateManager,
+) -> Iterator[SyncStateManager]:
+    """Lend the shared sync state manager to a test that needs no fresh files."""
+    yield _shared_sync_manager
+    _shared_sync_manager._synced_entries.clear()
+    _shared_sync_manager.state_file.unlink(missing_ok=True)
+
+
+@pytest.fixture(scope="session")
+def _seeded_sync_manager_bytes(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> bytes:
+    """Pickle a manager that has already recorded the standard test entry."""
+    state_file = tmp_path_factory.mktemp("sync_state_seeded") / "sync_state.json"
+    manager = SyncStateManager(state_file=state_file)
+    manager.record_sync(
+        target_date=_SEEDED_DATE,
+        workspace_id=123,
+        project_id=456,
+        description="Test Entry",
+    )
+    return pickle.dumps(manager)
+
+
+@pytest.fixture
+def seeded_sync_manager(
+    _seeded_sync_manager_bytes: bytes, tmp_path: Path
+) -> SyncStateManager:
+    """Create a sync state manager that already holds the standard test entry."""
+    manager = pickle.loads(_seeded_sync_manager_bytes)
+    manager.state_file = tmp_path / "sync_state.json"
+    return manager
 
 
 @pytest.mark.unit
-def test_sync_state_manager_initialization(sync_manager: SyncStateManager) -> None:
+def test_sync_state_manager_initialization(
+    sync_manager_shared: SyncStateManager,
+) -> None:
     """Test that sync state manager initializes correctly."""
     # The state file is created lazily when we first save
-    assert sync_manager.state_file.name == "sync_state.json"
-    assert isinstance(sync_manager._synced_entries, dict)
-    assert len(sync_manager._synced_entries) == 0
+    assert sync_manager_shared.state_file.name == "sync_state.json"
+    assert isinstance(sync_manager_shared._synced_entries, dict)
+    assert len(sync_manager_shared._synced_entries) == 0
 
 
 @pytest.mark.unit
-def test_generate_entry_key(sync_manager: SyncStateManager) -> None:
+def test_generate_entry_key(sync_manager_shared: SyncStateManager) -> None:
     """Test entry key generation."""
     test_date = date(2023, 12, 25)
-    key = sync_manager._generate_entry_key(test_date, 123, 456, "Test Description")
+    key = sync_manager_shared._generate_entry_key(
+        test_date, 123, 456, "Test Description"
+    )
 
     expected = "2023-12-25:123:456:Test Description"
     assert key == expected
 
 
 @pytest.mark.unit
-def test_has_been_synced_new_entry(sync_manager: SyncStateManager) -> None:
+def test_has_been_synced_new_entry(sync_manager_shared: SyncStateManager) -> None:
     """Test checking for sync status on new entry."""
     test_date = date(2023, 12, 25)
 
     # Should return False for new entry
-    assert not sync_manager.has_been_synced(test_date, 123, 456, "Test Entry")
+    assert not sync_manager_shared.has_been_synced(test_date, 123, 456, "Test Entry")
 
 
 @pytest.mark.unit
@@ -69,59 +145,42 @@ def test_record_and_check_sync(sync_manager: SyncStateManager) -> None:
 
 
 @pytest.mark.unit
-def test_get_synced_entry(sync_manager: SyncStateManager) -> None:
+def test_get_synced_entry(seeded_sync_manager: SyncStateManager) -> None:
     """Test retrieving synced entry details."""
-    test_date = date(2023, 12, 25)
-
-    # Record a sync
-    sync_manager.record_sync(
-        target_date=test_date,
-        workspace_id=123,
-        project_id=456,
-        description="Test Entry",
-    )
-
     # Retrieve the entry (simplified interface)
-    entry = sync_manager.get_synced_entry(test_date, 123, 456, "Test Entry")
+    entry = seeded_sync_manager.get_synced_entry(_SEEDED_DATE, 123, 456, "Test Entry")
 
     assert entry is not None
     assert entry["exists"] == True
 
     # Should return empty dict for non-existent entry
-    non_existent = sync_manager.get_synced_entry(test_date, 999, 999, "Non-existent")
+    non_existent = seeded_sync_manager.get_synced_entry(
+        _SEEDED_DATE, 999, 999, "Non-existent"
+    )
     assert non_existent == {}
 
 
 @pytest.mark.unit
-def test_record_sync_multiple_times(sync_manager: SyncStateManager) -> None:
+def test_record_sync_multiple_times(seeded_sync_manager: SyncStateManager) -> None:
     """Test recording multiple syncs for the same entry."""
-    test_date = date(2023, 12, 25)
-
-    # Record first sync
-    sync_manager.record_sync(
-        target_date=test_date,
-        workspace_id=123,
-        project_id=456,
-        description="Test Entry",
-    )
-
-    # Record second sync (update)
-    sync_manager.record_sync(
-        target_date=test_date,
+    # Record second sync (update) on top of the seeded first one
+    seeded_sync_manager.record_sync(
+        target_date=_SEEDED_DATE,
         workspace_id=123,
         project_id=456,
         description="Test Entry",
     )
 
     # Check that entry still exists (simplified interface doesn't track metadata)
-    entry = sync_manager.get_synced_entry(test_date, 123, 456, "Test Entry")
+    entry = seeded_sync_manager.get_synced_entry(_SEEDED_DATE, 123, 456, "Test Entry")
     assert entry["exists"] == True
 
     # Entry should still be marked as synced
-    assert sync_manager.has_been_synced(test_date, 123, 456, "Test Entry")
+    assert seeded_sync_manager.has_been_synced(_SEEDED_DATE, 123, 456, "Test Entry")
 
 
 @pytest.mark.unit
+@pytest.mark.persist
 def test_multiple_entries_persistence(sync_manager: SyncStateManager) -> None:
     """Test recording and persistence of multiple entries."""
     # Record entries from different dates
@@ -131,34 +190,37 @@ def test_multiple_entries_persistence(sync_manager: SyncStateManager) -> None:
 
     start_time = datetime.combine(today, datetime.min.time())
 
-    # Record old entry (should be cleaned up)
-    sync_manager.record_sync(
-        target_date=old_date,
-        workspace_id=123,
-        project_id=456,
-        description="Old Entry",
-    )
-
-    # Record recent entry (should be kept)
-    sync_manager.record_sync(
-        target_date=recent_date,
-        workspace_id=123,
-        project_id=456,
-        description="Recent Entry",
-    )
-
-    # Record today's entry (should be kept)
-    sync_manager.record_sync(
-        target_date=today,
-        workspace_id=123,
-        project_id=456,
-        description="Today Entry",
-    )
-
-    # Verify all entries exist (simplified interface doesn't have cleanup)
-    assert sync_manager.has_been_synced(old_date, 123, 456, "Old Entry")
-    assert sync_manager.has_been_synced(recent_date, 123, 456, "Recent Entry")
-    assert sync_manager.has_been_synced(today, 123, 456, "Today Entry")
+    with sync_manager.batch():
+        # Record old entry (should be cleaned up)
+        sync_manager.record_sync(
+            target_date=old_date,
+            workspace_id=123,
+            project_id=456,
+            description="Old Entry",
+        )
+
+        # Record recent entry (should be kept)
+        sync_manager.record_sync(
+            target_date=recent_date,
+            workspace_id=123,
+            project_id=456,
+            description="Recent Entry",
+        )
+
+        # Record today's entry (should be kept)
+        sync_manager.record_sync(
+            target_date=today,
+            workspace_id=123,
+            project_id=456,
+            description="Today Entry",
+        )
+
+    # Verify all entries were written once the batch exited
+    # (simplified interface doesn't have cleanup)
+    reloaded = SyncStateManager(state_file=sync_manager.state_file)
+    assert reloaded.has_been_synced(old_date, 123, 456, "Old Entry")
+    assert reloaded.has_been_synced(recent_date, 123, 456, "Recent Entry")
+    assert reloaded.has_been_synced(today, 123, 456, "Today Entry")
 
 
 @pytest.mark.unit
@@ -185,14 +247,14 @@ def test_malformed_state_file_handling(
 
 
 @pytest.mark.unit
-def test_entry_key_uniqueness(sync_manager: SyncStateManager) -> None:
+def test_entry_key_uniqueness(sync_manager_shared: SyncStateManager) -> None:
     """Test that entry keys are unique for different parameters."""
     test_date = date(2023, 12, 25)
 
-    key1 = sync_manager._generate_entry_key(test_date, 123, 456, "Description A")
-    key2 = sync_manager._generate_entry_key(test_date, 123, 456, "Description B")
-    key3 = sync_manager._generate_entry_key(test_date, 123, 789, "Description A")
-    key4 = sync_manager._generate_entry_key(test_date, 456, 456, "Description A")
+    key1 = sync_manager_shared._generate_entry_key(test_date, 123, 456, "Description A")
+    key2 = sync_manager_shared._generate_entry_key(test_date, 123, 456, "Description B")
+    key3 = sync_manager_shared._generate_entry_key(test_date, 123, 789, "Description A")
+    key4 = sync_manager_shared._generate_entry_key(test_date, 456, 456, "Description A")
 
     # All keys should be different
     keys = [key1, key2, key3, key4]
@@ -202,8 +264,6 @@ def test_entry_key_uniqueness(sync_manager: SyncStateManager) -> None:
 @pytest.mark.unit
 def test_new_complete_data_storage(sync_manager: SyncStateManager) -> None:
     """Test that the new sync state manager stores and retrieves complete data."""
-    from datetime import datetime, timezone
-
     test_date = date(2023, 12, 25)
     start_time = datetime(2023, 12, 25, 10, 30, 0, tzinfo=timezone.utc)
     duration_seconds = 3600
@@ -270,12 +330,11 @@ def test_backward_compatibility_minimal_record_sync(
 
 
 @pytest.mark.unit
+@pytest.mark.persist
 def test_data_format_consistency_across_saves(
     sync_manager: SyncStateManager, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     """Test that the new data format is consistent when saving and loading."""
-    from datetime import datetime, timezone
-
     test_date = date(2023, 12, 25)
     start_time = datetime(2023, 12, 25, 14, 15, 0, tzinfo=timezone.utc)
 
@@ -1,15 +1,14 @@
 import json
-import os
 from datetime import date
 from pathlib import Path
 
 import pytest
 
+from src.sync_state_manager import SyncStateManager
+
 
 @pytest.mark.unit
 def test_clear_stale_entry_removes_and_noop(tmp_path: Path) -> None:
-    from src.sync_state_manager import SyncStateManager
-
     mgr = SyncStateManager(state_file=tmp_path / "sync_state" / "state.json")
     d = date(2024, 1, 1)
     mgr.record_sync(d, 1, 2, "desc")
@@ -25,8 +24,6 @@ def test_clear_stale_entry_removes_and_noop(tmp_path: Path) -> None:
 
 @pytest.mark.unit
 def test_save_synced_entries_atomic(tmp_path: Path) -> None:
-    from src.sync_state_manager import SyncStateManager
-
     state_file = tmp_path / "sync_state" / "state.json"
     mgr = SyncStateManager(state_file=state_file)
     d = date(2024, 1, 2)
@@ -34,12 +31,45 @@ def test_save_synced_entries_atomic(tmp_path: Path) -> None:
 
     # File should exist and contain json
     assert state_file.exists()
-    with open(state_file, encoding="utf-8") as f:
-        data = json.load(f)
+    data = json.loads(state_file.read_bytes())
     assert isinstance(data, dict)
 
     # Atomic assurance: directory should not contain tmp file leftovers
-    names = os.listdir(state_file.parent)
-    assert all(
-        not n.startswith("sync_state_") or not n.endswith(".json") for n in names
+    assert next(state_file.parent.glob("sync_state_*.json"), None) is None
+
+
+@pytest.mark.unit
+def test_batch_saves_once_on_exit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    mgr = SyncStateManager(state_file=tmp_path / "sync_state" / "state.json")
+    saves: list[int] = []
+    monkeypatch.setattr(
+        mgr, "_save_synced_entries", lambda: saves.append(len(mgr._synced_entries))
     )
+
+    with mgr.batch():
+        mgr.record_sync(date(2024, 1, 1), 1, 2, "a")
+        mgr.record_sync(date(2024, 1, 2), 1, 2, "b")
+        mgr.clear_stale_entry(date(2024, 1, 1), 1, 2, "a")
+        assert saves == []
+
+    assert saves == [1]
+    mgr.record_sync(date(2024, 1, 3), 1, 2, "c")
+    assert saves == [1, 2]
+
+    # Nested blocks defer until the outermost one exits
+    with mgr.batch():
+        with mgr.batch():
+            mgr.record_sync(date(2024, 1, 4), 1, 2, "d")
+        mgr.record_sync(date(2024, 1, 5), 1, 2, "e")
+        assert saves == [1, 2]
+    assert saves == [1, 2, 4]
+
+    # A failing block skips the save and keeps the original exception
+    with pytest.raises(RuntimeError, match="boom"), mgr.batch():
+        mgr.record_sync(date(2024, 1, 6), 1, 2, "f")
+        raise RuntimeError("boom")
+    assert saves == [1, 2, 4]
+    mgr.record_sync(date(2024, 1, 7), 1, 2, "g")
+    assert saves == [1, 2, 4, 6]
@@ -1,13 +1,17 @@
 from base64 import b64decode
-from unittest.mock import MagicMock
 
 import pytest
+import requests
+from pytest_mock import MockerFixture, MockType
 
+from src.constants import TOGGL_API_BASE_URL, TOGGL_USER_ENDPOINT
 from src.toggl_track_entry_creator import TogglTrackEntryCreator
+from tests.conftest import FakeResponse
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def entry_creator() -> TogglTrackEntryCreator:
+    """Build one creator per module; tests only read its attributes."""
     return TogglTrackEntryCreator(
         api_token="apitoken123",
         workspace_id=1,
@@ -16,6 +20,12 @@ def entry_creator() -> TogglTrackEntryCreator:
     )
 
 
+@pytest.fixture(autouse=True)
+def mock_request(mocker: MockerFixture) -> MockType:
+    """Patch requests.Session.request so no test in this module hits the network."""
+    return mocker.patch("requests.Session.request")
+
+
 @pytest.mark.unit
 def test_headers_produces_valid_basic_auth(entry_creator):  # type: ignore[no-redef]
     headers = entry_creator._headers()
@@ -24,24 +34,14 @@ def test_headers_produces_valid_basic_auth(entry_creator):  # type: ignore[no-re
     assert scheme == "Basic"
     decoded = b64decode(token.encode()).decode()
     assert decoded == "apitoken123:api_token"
+    # Memoized per instance, so every request reuses the same headers
+    assert entry_creator._headers() is headers
 
 
 @pytest.mark.unit
-def test_request_error_paths_logged_and_raise(mocker: MagicMock, entry_creator):  # type: ignore[no-redef]
-    import requests
-
-    # 4xx/5xx path
-    mock_request = mocker.patch("requests.Session.request")
-    bad = MagicMock()
-    bad.status_code = 500
-    bad.text = "ERR"
-
-    # raise_for_status triggers RequestException
-    def raise_http() -> None:
-        raise requests.HTTPError("boom", response=bad)
-
-    bad.raise_for_status.side_effect = raise_http
-    mock_request.return_value = bad
+def test_request_error_paths_logged_and_raise(mock_request: MockType, entry_creator):  # type: ignore[no-redef]
+    # 4xx/5xx path: raise_for_status on a 5xx response raises HTTPError
+    mock_request.return_value = FakeResponse(500, text="ERR")
 
     with pytest.raises(requests.HTTPError):
         entry_creator._request("get", entry_creator.user_api_url)
@@ -53,14 +53,8 @@ def test_request_error_paths_logged_and_raise(mocker: MagicMock, entry_creator):
 
 
 @pytest.mark.unit
-def test_get_user_info_calls_me_and_returns_json(mocker: MagicMock, entry_creator):  # type: ignore[no-redef]
-    from src.constants import TOGGL_API_BASE_URL, TOGGL_USER_ENDPOINT
-
-    mock_request = mocker.patch("requests.Session.request")
-    resp = MagicMock()
-    resp.status_code = 200
-    resp.json.return_value = {"user": 1}
-    mock_request.return_value = resp
+def test_get_user_info_calls_me_and_returns_json(mock_request: MockType, entry_creator):  # type: ignore[no-redef]
+    mock_request.return_value = FakeResponse(200, {"user": 1})
 
     data = entry_creator.get_user_info()
     assert data == {"user": 1}